@@ -1,13 +1,21 @@
 """Service for managing price alerts"""
 
+import sqlite3
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, Callable
+from typing import Callable, List, Optional
 
 from database import PriceRepository
 from models import PriceAlert, TriggeredAlert, AlertType
 from exceptions import DatabaseError, ValidationError
 from validators import InputValidator
+from converters import to_decimal, parse_timestamp
+
+
+_ALERT_COLUMNS = (
+    "id, asset_id, alert_type, threshold_value, currency, "
+    "active, triggered, triggered_at, notification_sent, notes, created_at"
+)
 
 
 class AlertService:
@@ -60,43 +68,30 @@ class AlertService:
     def get_active_alerts(self, asset_id: Optional[int] = None) -> List[PriceAlert]:
         """Get all active (non-triggered) alerts."""
         try:
-            query = """
-                SELECT id, asset_id, alert_type, threshold_value, currency,
-                       active, triggered, triggered_at, notification_sent, notes, created_at
-                FROM price_alert
-                WHERE active = 1 AND triggered = 0
-            """
-            params: List = []
-
             if asset_id:
-                query += " AND asset_id = ?"
-                params.append(asset_id)
-
-            query += " ORDER BY created_at DESC"
-            rows = self._db.execute(query, tuple(params)).fetchall()
-            return [self._row_to_alert(row) for row in rows]
+                cursor = self._select_alerts("active = 1 AND triggered = 0 AND asset_id = ?", "created_at DESC", (asset_id,))
+            else:
+                cursor = self._select_alerts("active = 1 AND triggered = 0", "created_at DESC")
+            return [self._row_to_alert(row) for row in cursor]
         except Exception as e:
             raise DatabaseError("Fehler beim Laden der Alarme", str(e))
 
     def get_all_alerts(self, include_triggered: bool = False) -> List[PriceAlert]:
         """Get all alerts."""
         try:
-            query = """
-                SELECT id, asset_id, alert_type, threshold_value, currency,
-                       active, triggered, triggered_at, notification_sent, notes, created_at
-                FROM price_alert
-                WHERE 1=1
-            """
-
-            if not include_triggered:
-                query += " AND triggered = 0"
-
-            query += " ORDER BY triggered, created_at DESC"
-            rows = self._db.execute(query).fetchall()
+            where = "1 = 1" if include_triggered else "triggered = 0"
+            rows = self._select_alerts(where, "triggered, created_at DESC").fetchall()
             return [self._row_to_alert(row) for row in rows]
         except Exception as e:
             raise DatabaseError("Fehler beim Laden der Alarme", str(e))
 
+    def _select_alerts(self, where: str, order_by: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Run the shared alert SELECT; identical SQL text per filter keeps SQLite's statement cache warm."""
+        return self._db.execute(
+            f"SELECT {_ALERT_COLUMNS} FROM price_alert WHERE {where} ORDER BY {order_by}",
+            params
+        )
+
     def delete_alert(self, alert_id: int) -> None:
         """Delete an alert."""
         try:
@@ -117,99 +112,97 @@ class AlertService:
         """Check all active alerts against current prices."""
         try:
             triggered: List[TriggeredAlert] = []
-            alerts = self.get_active_alerts()
-
-            for alert in alerts:
-                price_row = self._db.execute(
-                    """
-                    SELECT a.symbol, a.name, p.close
-                    FROM asset a
-                    LEFT JOIN (
-                        SELECT p1.asset_id, p1.close
-                        FROM price p1
-                        INNER JOIN (
-                            SELECT asset_id, MAX(price_date) AS max_date
-                            FROM price
-                            GROUP BY asset_id
-                        ) latest ON latest.asset_id = p1.asset_id AND latest.max_date = p1.price_date
-                    ) p ON a.id = p.asset_id
-                    WHERE a.id = ?
-                    """,
-                    (alert.asset_id,)
-                ).fetchone()
-
-                if not price_row or price_row[2] is None:
-                    continue
-
-                symbol, name, current_price_raw = price_row
-                current_price = Decimal(str(current_price_raw))
 
-                is_triggered = False
-                message = ""
-
-                if alert.alert_type == AlertType.ABOVE and current_price >= alert.threshold_value:
-                    is_triggered = True
+            # SQLite only returns alerts whose threshold is reached. The %-change
+            # filter is slightly lenient (float math) and confirmed in Decimal below.
+            rows = self._db.execute(
+                """
+                WITH ranked AS (
+                    SELECT asset_id, close,
+                           ROW_NUMBER() OVER (PARTITION BY asset_id ORDER BY price_date DESC) AS rn
+                    FROM price
+                    WHERE asset_id IN (
+                        SELECT asset_id FROM price_alert WHERE active = 1 AND triggered = 0
+                    )
+                ),
+                latest AS (
+                    SELECT cur.asset_id, cur.close, prev.close AS prev_close
+                    FROM ranked cur
+                    LEFT JOIN ranked prev ON prev.asset_id = cur.asset_id AND prev.rn = 2
+                    WHERE cur.rn = 1
+                )
+                SELECT pa.id, pa.asset_id, pa.alert_type, pa.threshold_value, pa.currency,
+                       pa.active, pa.triggered, pa.triggered_at, pa.notification_sent, pa.notes,
+                       pa.created_at, a.symbol, a.name, l.close, l.prev_close
+                FROM price_alert pa
+                JOIN asset a ON a.id = pa.asset_id
+                JOIN latest l ON l.asset_id = pa.asset_id
+                WHERE pa.active = 1 AND pa.triggered = 0
+                  AND (
+                    (pa.alert_type = 'above' AND l.close >= pa.threshold_value)
+                    OR (pa.alert_type = 'below' AND l.close <= pa.threshold_value)
+                    OR (pa.alert_type = 'change_percent' AND l.prev_close > 0
+                        AND ABS(l.close - l.prev_close) * 100 >= pa.threshold_value * l.prev_close * 0.999999)
+                  )
+                ORDER BY pa.created_at DESC
+                """
+            ).fetchall()
+
+            for row in rows:
+                alert = self._row_to_alert(row)
+                symbol, name, current_close, yesterday_close = row[11:15]
+                current_price = to_decimal(current_close)
+
+                if alert.alert_type == AlertType.ABOVE:
                     message = (
                         f"{symbol} hat {alert.threshold_value} {alert.currency} überschritten!\n"
                         f"Aktueller Kurs: {current_price} {alert.currency}"
                     )
-                elif alert.alert_type == AlertType.BELOW and current_price <= alert.threshold_value:
-                    is_triggered = True
+                elif alert.alert_type == AlertType.BELOW:
                     message = (
                         f"{symbol} ist unter {alert.threshold_value} {alert.currency} gefallen!\n"
                         f"Aktueller Kurs: {current_price} {alert.currency}"
                     )
-                elif alert.alert_type == AlertType.CHANGE_PERCENT:
-                    yesterday_row = self._db.execute(
+                else:
+                    yesterday_price = to_decimal(yesterday_close)
+                    change_percent = abs(((current_price / yesterday_price) - Decimal("1")) * Decimal("100"))
+                    if change_percent < alert.threshold_value:
+                        continue
+
+                    direction = "gestiegen" if current_price > yesterday_price else "gefallen"
+                    message = (
+                        f"{symbol} ist um {change_percent:.2f}% {direction}!\n"
+                        f"Schwellwert: {alert.threshold_value}%"
+                    )
+
+                triggered.append(
+                    TriggeredAlert(
+                        alert=alert,
+                        symbol=symbol,
+                        name=name,
+                        current_price=current_price,
+                        message=message,
+                    )
+                )
+
+            if triggered:
+                triggered_at = datetime.now().replace(microsecond=0)
+                now_value = triggered_at.isoformat(sep=" ")
+                with self._db.transaction():
+                    self._db.executemany(
                         """
-                        SELECT close FROM price
-                        WHERE asset_id = ? AND price_date < (
-                            SELECT MAX(price_date) FROM price WHERE asset_id = ?
-                        )
-                        ORDER BY price_date DESC
-                        LIMIT 1
+                        UPDATE price_alert
+                        SET triggered = 1, triggered_at = ?, notification_sent = 1
+                        WHERE id = ?
                         """,
-                        (alert.asset_id, alert.asset_id)
-                    ).fetchone()
-
-                    if yesterday_row:
-                        yesterday_price = Decimal(str(yesterday_row[0]))
-                        if yesterday_price > 0:
-                            change_percent = abs(((current_price / yesterday_price) - Decimal("1")) * Decimal("100"))
-                            if change_percent >= alert.threshold_value:
-                                is_triggered = True
-                                direction = "gestiegen" if current_price > yesterday_price else "gefallen"
-                                message = (
-                                    f"{symbol} ist um {change_percent:.2f}% {direction}!\n"
-                                    f"Schwellwert: {alert.threshold_value}%"
-                                )
-
-                if is_triggered:
-                    now_value = datetime.now().isoformat(sep=" ", timespec="seconds")
-                    with self._db.transaction():
-                        self._db.execute(
-                            """
-                            UPDATE price_alert
-                            SET triggered = 1, triggered_at = ?, notification_sent = 1
-                            WHERE id = ?
-                            """,
-                            (now_value, alert.id)
-                        )
-
-                    alert.triggered = True
-                    alert.triggered_at = datetime.fromisoformat(now_value)
-                    alert.notification_sent = True
-
-                    triggered.append(
-                        TriggeredAlert(
-                            alert=alert,
-                            symbol=symbol,
-                            name=name,
-                            current_price=current_price,
-                            message=message,
-                        )
+                        [(now_value, item.alert.id) for item in triggered]
                     )
 
+                for item in triggered:
+                    item.alert.triggered = True
+                    item.alert.triggered_at = triggered_at
+                    item.alert.notification_sent = True
+
             if triggered and self._notification_callback:
                 self._notification_callback(triggered)
 
@@ -223,12 +216,12 @@ class AlertService:
             id=row[0],
             asset_id=row[1],
             alert_type=AlertType(row[2]),
-            threshold_value=Decimal(str(row[3])),
+            threshold_value=to_decimal(row[3]),
             currency=row[4],
             active=bool(row[5]),
             triggered=bool(row[6]),
-            triggered_at=datetime.fromisoformat(row[7]) if row[7] else None,
+            triggered_at=parse_timestamp(row[7]),
             notification_sent=bool(row[8]),
             notes=row[9],
-            created_at=datetime.fromisoformat(row[10]) if row[10] else None,
+            created_at=parse_timestamp(row[10]),
         )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import re
-import shutil
+import os
+import sqlite3
+import string
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import List, Optional
@@ -13,10 +14,10 @@ from models import BackupInfo
 class BackupService:
     """Service for creating, listing, restoring and cleaning database backups."""
 
-    _DAILY_PATTERN = re.compile(r"^portfolio_backup_(\d{4}-\d{2}-\d{2})\.db$")
-    _ACTION_PATTERN = re.compile(
-        r"^portfolio_backup_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2}-\d{2})_vor_([a-zA-Z0-9_\-]+)\.db$"
-    )
+    _FILE_PREFIX = "portfolio_backup_"
+    _FILE_SUFFIX = ".db"
+    _ACTION_SEPARATOR = "_vor_"
+    _ACTION_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
     def __init__(self, db_path: Path, backup_dir: Path):
         """
@@ -28,6 +29,7 @@ class BackupService:
         self.backup_dir = Path(backup_dir)
         self.retention_days = 30
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self._last_daily_date: Optional[date] = None
 
     def create_backup(self, action_name: str = None) -> Path:
         """
@@ -57,7 +59,7 @@ class BackupService:
                 file_name = f"portfolio_backup_{now.strftime('%Y-%m-%d')}.db"
 
             backup_path = self.backup_dir / file_name
-            shutil.copy2(self.db_path, backup_path)
+            self._copy_database(self.db_path, backup_path)
             return backup_path
         except BackupError:
             raise
@@ -74,12 +76,18 @@ class BackupService:
         Returns:
             Path zum Backup oder None wenn bereits existiert
         """
-        today_name = f"portfolio_backup_{date.today().isoformat()}.db"
-        existing = self.backup_dir / today_name
+        today = date.today()
+        if self._last_daily_date == today:
+            return None
+
+        existing = self.backup_dir / f"portfolio_backup_{today.isoformat()}.db"
         if existing.exists():
+            self._last_daily_date = today
             return None
 
-        return self.create_backup()
+        backup_path = self.create_backup()
+        self._last_daily_date = today
+        return backup_path
 
     def cleanup_old_backups(self) -> int:
         """
@@ -89,17 +97,17 @@ class BackupService:
             Anzahl gelöschter Backups
         """
         backups = self.list_backups()
-        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        cutoff_ts = int((datetime.now() - timedelta(days=self.retention_days)).timestamp())
         deleted = 0
 
         for backup in backups:
             if backup.is_monthly:
                 continue
-            if backup.created_date < cutoff:
+            if backup.created_ts < cutoff_ts:
                 try:
                     backup.file_path.unlink(missing_ok=True)
                     deleted += 1
-                except Exception:
+                except OSError:
                     continue
 
         return deleted
@@ -116,23 +124,28 @@ class BackupService:
         if not self.backup_dir.exists():
             return backups
 
-        for file_path in self.backup_dir.glob("portfolio_backup_*.db"):
-            parsed = self._parse_backup_filename(file_path.name)
-            if not parsed:
-                continue
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(self._FILE_PREFIX) or not name.endswith(self._FILE_SUFFIX):
+                    continue
 
-            created_date, action_name = parsed
-            is_monthly = created_date.day == 1
-            backups.append(
-                BackupInfo(
-                    file_path=file_path,
-                    file_name=file_path.name,
-                    size_bytes=file_path.stat().st_size,
-                    created_date=created_date,
-                    is_monthly=is_monthly,
-                    action_name=action_name,
+                parsed = self._parse_backup_filename(name)
+                if not parsed:
+                    continue
+
+                created_date, action_name = parsed
+                is_monthly = created_date.day == 1
+                backups.append(
+                    BackupInfo(
+                        file_path=Path(entry.path),
+                        file_name=name,
+                        size_bytes=entry.stat().st_size,
+                        created_date=created_date,
+                        is_monthly=is_monthly,
+                        action_name=action_name,
+                    )
                 )
-            )
 
         backups.sort(key=lambda info: info.created_date, reverse=True)
         return backups
@@ -157,30 +170,88 @@ class BackupService:
                 self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
             temp_target = self.db_path.with_suffix(".db.restore_tmp")
-            shutil.copy2(backup_path, temp_target)
+            temp_target.unlink(missing_ok=True)
+            self._copy_database(backup_path, temp_target)
+
+            # Ein liegengebliebenes WAL der alten Datenbank würde beim nächsten
+            # Öffnen auf die wiederhergestellte Datei angewendet
+            for suffix in ("-wal", "-shm"):
+                self.db_path.with_name(self.db_path.name + suffix).unlink(missing_ok=True)
             temp_target.replace(self.db_path)
         except BackupError:
             raise
         except Exception as exc:
             raise BackupError("Backup konnte nicht wiederhergestellt werden", str(exc)) from exc
 
+    @staticmethod
+    def _copy_database(source: Path, target: Path) -> None:
+        """
+        Kopiert eine SQLite-Datenbank über die Online-Backup-API
+
+        Im Gegensatz zu einer reinen Dateikopie liest die Backup-API
+        konsistente Seiten (inkl. WAL-Inhalt) und kann keine halb
+        geschriebene Datei erwischen.
+        """
+        source_stat = source.stat()
+        # Lesend-schreibend öffnen: nur so räumt SQLite beim Schließen die
+        # -wal/-shm-Dateien einer WAL-Datenbank wieder weg
+        src = sqlite3.connect(source)
+        try:
+            dst = sqlite3.connect(target)
+            try:
+                src.backup(dst, pages=1024)
+            finally:
+                dst.close()
+        finally:
+            src.close()
+
+        os.utime(target, (source_stat.st_atime, source_stat.st_mtime))
+
     @staticmethod
     def _sanitize_action_name(action_name: str) -> str:
         safe = action_name.strip().lower().replace(" ", "_")
-        safe = re.sub(r"[^a-zA-Z0-9_\-]", "", safe)
+        safe = "".join(char for char in safe if char in BackupService._ACTION_CHARS)
         return safe or "aktion"
 
     def _parse_backup_filename(self, file_name: str) -> Optional[tuple[datetime, Optional[str]]]:
-        daily_match = self._DAILY_PATTERN.match(file_name)
-        if daily_match:
-            date_str = daily_match.group(1)
-            return datetime.strptime(date_str, "%Y-%m-%d"), None
-
-        action_match = self._ACTION_PATTERN.match(file_name)
-        if action_match:
-            date_str, time_str, action_name = action_match.groups()
-            date_time_str = f"{date_str} {time_str}"
-            created = datetime.strptime(date_time_str, "%Y-%m-%d %H-%M-%S")
-            return created, action_name
-
-        return None
+        """
+        Parst 'portfolio_backup_YYYY-MM-DD.db' und
+        'portfolio_backup_YYYY-MM-DD_HH-MM-SS_vor_<aktion>.db' anhand fester Positionen
+        """
+        if not file_name.startswith(self._FILE_PREFIX) or not file_name.endswith(self._FILE_SUFFIX):
+            return None
+
+        core = file_name[len(self._FILE_PREFIX):-len(self._FILE_SUFFIX)]
+        if len(core) == 10:
+            date_str, time_str, action_name = core, "00-00-00", None
+        elif len(core) > 24 and core[10] == "_" and core[19:24] == self._ACTION_SEPARATOR:
+            date_str, time_str, action_name = core[:10], core[11:19], core[24:]
+            if not self._ACTION_CHARS.issuperset(action_name):
+                return None
+        else:
+            return None
+
+        if not self._is_fixed_width(date_str, (4, 7)) or not self._is_fixed_width(time_str, (2, 5)):
+            return None
+
+        try:
+            return self._build_datetime(date_str, time_str), action_name
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _is_fixed_width(value: str, separators: tuple[int, int]) -> bool:
+        """Check 'NNNN-NN-NN' / 'NN-NN-NN' shape: '-' at both separators, digits elsewhere."""
+        return (
+            value[separators[0]] == "-"
+            and value[separators[1]] == "-"
+            and value.replace("-", "").isdigit()
+        )
+
+    @staticmethod
+    def _build_datetime(date_str: str, time_str: str = "00-00-00") -> datetime:
+        """Build datetime from fixed-width 'YYYY-MM-DD' and 'HH-MM-SS' parts."""
+        return datetime(
+            int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+            int(time_str[0:2]), int(time_str[3:5]), int(time_str[6:8]),
+        )
@@ -6,9 +6,13 @@ Used by build_release.py.
 
 from __future__ import annotations
 
+import ctypes
+import importlib.util
 import shutil
 import subprocess
 import sys
+import zipfile
+from collections import deque
 from pathlib import Path
 
 APP_NAME = "MeinPortfolio-App"
@@ -21,14 +25,40 @@ BUILD_DIR = ROOT / "build"
 TMP_WORK_DIR = BUILD_DIR / "pyinstaller"
 TMP_DIST_DIR = BUILD_DIR / "dist_tmp"
 
+# Number of PyInstaller output lines kept for error reports
+OUTPUT_TAIL_LINES = 200
+
+# Already compressed formats are stored as-is in the portable ZIP
+PRECOMPRESSED_SUFFIXES = {".zip", ".pyz", ".png", ".jpg", ".jpeg", ".gif", ".gz", ".bz2", ".xz"}
+
 
 def _run(cmd: list[str]) -> subprocess.CompletedProcess:
-    return subprocess.run(
+    """Run command, keeping only the last OUTPUT_TAIL_LINES lines of combined output."""
+    tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    with subprocess.Popen(
         cmd,
         cwd=str(ROOT),
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
-    )
+        errors="replace",
+        bufsize=1,
+    ) as proc:
+        for line in proc.stdout:
+            tail.append(line)
+        returncode = proc.wait()
+
+    return subprocess.CompletedProcess(cmd, returncode, stdout="".join(tail), stderr="")
+
+
+def _fast_copy(src: str | Path, dst: str | Path) -> None:
+    """Copy a file with metadata, using the native CopyFileW on Windows."""
+    if sys.platform == "win32":
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+        return
+    # shutil already copies in-kernel (sendfile/fcopyfile) on POSIX
+    shutil.copy2(src, dst)
 
 
 def clean_build_dirs() -> None:
@@ -40,9 +70,8 @@ def clean_build_dirs() -> None:
 
 def build_exe() -> bool:
     """Build Windows EXE using PyInstaller (onedir)."""
-    try:
-        import PyInstaller  # type: ignore
-    except Exception:
+    # find_spec only checks sys.path; importing PyInstaller itself takes ~1s
+    if importlib.util.find_spec("PyInstaller") is None:
         print("❌ PyInstaller nicht gefunden. Installiere mit: pip install pyinstaller")
         return False
 
@@ -93,11 +122,8 @@ def build_exe() -> bool:
     if result.returncode != 0:
         print("❌ PyInstaller Build fehlgeschlagen")
         if result.stdout.strip():
-            print("\n--- stdout ---")
+            print(f"\n--- Ausgabe (letzte {OUTPUT_TAIL_LINES} Zeilen) ---")
             print(result.stdout)
-        if result.stderr.strip():
-            print("\n--- stderr ---")
-            print(result.stderr)
         return False
 
     print("✅ EXE Build erfolgreich")
@@ -117,9 +143,9 @@ def create_distribution_package() -> None:
     for item in source_dir.iterdir():
         destination = target_dir / item.name
         if item.is_dir():
-            shutil.copytree(item, destination, dirs_exist_ok=True)
+            shutil.copytree(item, destination, dirs_exist_ok=True, copy_function=_fast_copy)
         else:
-            shutil.copy2(item, destination)
+            _fast_copy(item, destination)
 
     print(f"✅ Distribution-Paket erstellt: {target_dir}")
 
@@ -130,7 +156,11 @@ def create_zip_archive() -> Path:
     if not source_dir.exists():
         raise FileNotFoundError(f"Paketordner fehlt: {source_dir}")
 
-    zip_base = DIST_DIR / f"{PACKAGE_DIR_NAME}-v{APP_VERSION}-Windows"
-    zip_path = Path(shutil.make_archive(str(zip_base), "zip", root_dir=source_dir))
+    zip_path = DIST_DIR / f"{PACKAGE_DIR_NAME}-v{APP_VERSION}-Windows.zip"
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for path in sorted(source_dir.rglob("*")):
+            arcname = path.relative_to(source_dir).as_posix()
+            stored = path.is_file() and path.suffix.lower() in PRECOMPRESSED_SUFFIXES
+            archive.write(path, arcname, compress_type=zipfile.ZIP_STORED if stored else None)
     print(f"✅ ZIP erstellt: {zip_path}")
     return zip_path
@@ -17,6 +17,7 @@ from __future__ import annotations
 import importlib
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -99,16 +100,31 @@ def main() -> int:
     print("✅ EXE erfolgreich erstellt.")
 
     print("\n[2/3] Erzeuge Paket/ZIP (falls verfügbar)...")
+    package_ok = True
     try:
         if hasattr(build, "create_distribution_package"):
             build.create_distribution_package()
-        if hasattr(build, "create_zip_archive"):
-            build.create_zip_archive()
-        print("✅ Paket/ZIP Schritt abgeschlossen.")
     except Exception as exc:
+        package_ok = False
         print(f"⚠️ Paket/ZIP konnte nicht vollständig erstellt werden: {exc}")
 
-    installer_ok = build_installer()
+    # ZIP and installer both only read dist/Portfolio-Manager -> build them in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        zip_future = None
+        if package_ok and hasattr(build, "create_zip_archive"):
+            zip_future = executor.submit(build.create_zip_archive)
+        installer_future = executor.submit(build_installer)
+
+        if zip_future is not None:
+            try:
+                zip_future.result()
+            except Exception as exc:
+                package_ok = False
+                print(f"⚠️ Paket/ZIP konnte nicht vollständig erstellt werden: {exc}")
+        installer_ok = installer_future.result()
+
+    if package_ok:
+        print("✅ Paket/ZIP Schritt abgeschlossen.")
 
     print("\n══════════════════════════════════════════════════════════════")
     if installer_ok:
@@ -1,15 +1,16 @@
 """
 Service for generating charts from price data
-"""
-import matplotlib
-matplotlib.use('TkAgg')  # Use TkAgg backend for embedding in Tkinter
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+matplotlib is imported lazily inside the chart methods so that starting the
+application does not pay for it until the first chart is rendered. Only the
+object-oriented API (Figure, FigureCanvasTkAgg) is used, so no pyplot
+backend has to be selected.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -18,16 +19,180 @@ import numpy as np
 from models import PriceView, ChartType, ChartConfig
 from exceptions import ChartError, DataNotFoundError
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+
+
+@lru_cache(maxsize=None)
+def _tab20() -> np.ndarray:
+    """tab20 palette as a read-only (20, 4) float32 RGBA array, built on first use"""
+    import matplotlib
+    
+    palette = np.asarray(matplotlib.colormaps['tab20'](np.arange(20)), dtype=np.float32)
+    palette.flags.writeable = False
+    return palette
+
+
+@lru_cache(maxsize=None)
+def _german_int_formatter_class() -> type:
+    """Tick formatter class for whole numbers with German thousands separator (1.234)"""
+    from matplotlib.ticker import Formatter
+    
+    class GermanIntFormatter(Formatter):
+        def __call__(self, x, pos=None):
+            return format(round(x), ',d').replace(',', '.')
+    
+    return GermanIntFormatter
+
+
+@lru_cache(maxsize=32)
+def _series_renderer(chart_type: ChartType, with_markers: bool) -> Callable:
+    """
+    Build the per-series plot function for one chart type/marker combination
+    
+    The returned function takes (ax, label, dates, values, color) and returns
+    the Line2D for line charts (None otherwise).
+    """
+    marker_kwargs = {'marker': 'o', 'markersize': 3} if with_markers else {'marker': None, 'markersize': 0}
+    
+    if chart_type == ChartType.LINE:
+        def render(ax, label, dates, values, color):
+            line, = ax.plot(
+                dates,
+                values,
+                label=label,
+                linewidth=2.2,
+                color=color,
+                alpha=0.95,
+                **marker_kwargs
+            )
+            return line
+    
+    elif chart_type == ChartType.AREA:
+        def render(ax, label, dates, values, color):
+            ax.fill_between(dates, values, alpha=0.5, label=label, color=color)
+            ax.plot(dates, values, linewidth=2, color=color)
+            return None
+    
+    else:
+        def render(ax, label, dates, values, color):
+            return None
+    
+    return render
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling to `threshold` points
+    
+    Keeps first and last point and, per bucket, the point spanning the
+    largest triangle with the previously kept point and the next bucket's
+    average, which preserves the visual shape of the line.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+    
+    xf = x.astype(np.float64)
+    yf = y.astype(np.float64)
+    bucket_size = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x = xf[end:next_end].mean()
+        avg_y = yf[end:next_end].mean()
+        area = np.abs(
+            (xf[a] - avg_x) * (yf[start:end] - yf[a])
+            - (xf[a] - xf[start:end]) * (avg_y - yf[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    
+    return x[selected], y[selected]
+
+
+def _to_date_numbers(dates) -> np.ndarray:
+    """Convert dates to int32 day numbers on matplotlib's date axis (days since its epoch)"""
+    from matplotlib import dates as mdates
+    
+    epoch = np.datetime64(mdates.get_epoch()).astype('datetime64[D]')
+    return (np.asarray(dates, dtype='datetime64[D]') - epoch).astype(np.int32)
+
+
+def _from_date_number(day_number: int) -> date:
+    """Inverse of _to_date_numbers for a single day number"""
+    from matplotlib import dates as mdates
+    
+    epoch = np.datetime64(mdates.get_epoch()).astype('datetime64[D]')
+    return (epoch + np.timedelta64(int(day_number), 'D')).astype(date)
+
+
+@dataclass(frozen=True)
+class PriceGroups:
+    """
+    Price series grouped by symbol in a flat (CSR-like) layout
+    
+    Series i spans dates_flat/values_flat[offsets[i]:offsets[i + 1]],
+    sorted by date. Symbols are sorted alphabetically.
+    """
+    symbols: np.ndarray      # str, size S
+    names: List[str]         # size S
+    offsets: np.ndarray      # int64, size S + 1
+    dates_flat: np.ndarray   # int32 matplotlib day numbers, size N
+    values_flat: np.ndarray  # float32, size N
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    def series(self, index: int, max_points: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (dates, values) for one symbol, LTTB-thinned to max_points if given"""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        dates, values = self.dates_flat[start:end], self.values_flat[start:end]
+        if max_points is not None and len(dates) > max_points:
+            return _lttb(dates, values, max_points)
+        return dates, values
+
 
 class ChartService:
     """Service for creating and managing charts"""
     
+    PREPARED_CACHE_SIZE = 8
+    COLLECTION_MIN_SYMBOLS = 8  # above this, series are drawn as one Line-/PolyCollection
+    _style_applied = False
+    
     def __init__(self):
-        # Set default matplotlib style
-        plt.style.use('seaborn-v0_8-whitegrid')
+        # Prepared chart data per input fingerprint (LRU, see _get_prepared_data)
+        self._prepared_cache: "OrderedDict[Tuple, PriceGroups]" = OrderedDict()
+        self._cache_generation = 0
+        
+        # Last line chart, reused via set_data when the same symbols are drawn again
+        self._fig: Optional["Figure"] = None
+        self._ax = None
+        self._lines: Dict[str, "Line2D"] = {}
+        self._fig_key: Optional[Tuple] = None
+        # True while a ChartWindow shows self._fig; cleared by release_figure
+        self._fig_in_use = False
+    
+    @classmethod
+    def _apply_style(cls) -> None:
+        """Import matplotlib on first use and set the default chart style once"""
+        if cls._style_applied:
+            return
+        import matplotlib
+        import matplotlib.style
+        
+        matplotlib.style.use('seaborn-v0_8-whitegrid')
         # Set German locale for better formatting
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = ['Segoe UI', 'Arial', 'DejaVu Sans']
+        matplotlib.rcParams['font.family'] = 'sans-serif'
+        matplotlib.rcParams['font.sans-serif'] = ['Segoe UI', 'Arial', 'DejaVu Sans']
+        cls._style_applied = True
     
     def validate_data(self, prices: List[PriceView]) -> None:
         """
@@ -46,7 +211,7 @@ class ChartService:
                 "Bitte wählen Sie einen Zeitraum mit vorhandenen Kursdaten."
             )
     
-    def prepare_data(self, prices: List[PriceView]) -> Dict[str, Dict]:
+    def prepare_data(self, prices: List[PriceView]) -> PriceGroups:
         """
         Prepare price data for charting
         
@@ -54,37 +219,42 @@ class ChartService:
             prices: List of price views
             
         Returns:
-            Dictionary with dates and values per symbol
+            Price series grouped by symbol, sorted by symbol and date
             
         Raises:
             ChartError: If data preparation fails
         """
         try:
-            # Group by symbol
-            data_by_symbol: Dict[str, Dict] = {}
+            count = len(prices)
+            symbols = np.array([price.symbol for price in prices], dtype=str)
+            # Compact plot inputs: float32 covers prices at FLOAT_PRECISION, int32 day numbers
+            # are what matplotlib converts dates to anyway
+            dates = _to_date_numbers([price.price_date for price in prices])
+            values = np.fromiter((price.close for price in prices), dtype=np.float32, count=count)
             
-            for price in prices:
-                if price.symbol not in data_by_symbol:
-                    data_by_symbol[price.symbol] = {
-                        'dates': [],
-                        'values': [],
-                        'name': price.name
-                    }
-                
-                data_by_symbol[price.symbol]['dates'].append(price.price_date)
-                data_by_symbol[price.symbol]['values'].append(price.close)
+            # Integer symbol codes + int32 days packed into one int64 key: a single
+            # stable C-level argsort orders by symbol, then date
+            unique_symbols, codes = np.unique(symbols, return_inverse=True)
+            sort_key = (codes.astype(np.int64) << 32) | (dates.astype(np.int64) + 2**31)
+            order = np.argsort(sort_key, kind='stable')
+            dates = dates[order]
+            values = values[order]
+            # Shared via the prepared-data cache: per-symbol views must stay read-only
+            dates.flags.writeable = False
+            values.flags.writeable = False
             
-            # Sort by date for each symbol
-            for symbol in data_by_symbol:
-                dates = data_by_symbol[symbol]['dates']
-                values = data_by_symbol[symbol]['values']
-                
-                # Combine, sort, and separate
-                combined = sorted(zip(dates, values))
-                data_by_symbol[symbol]['dates'] = [d for d, v in combined]
-                data_by_symbol[symbol]['values'] = [v for d, v in combined]
+            # Series boundaries in the sorted arrays
+            offsets = np.zeros(len(unique_symbols) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(codes, minlength=len(unique_symbols)), out=offsets[1:])
+            starts = offsets[:-1]
             
-            return data_by_symbol
+            return PriceGroups(
+                symbols=unique_symbols,
+                names=[prices[order[start]].name for start in starts.tolist()],
+                offsets=offsets,
+                dates_flat=dates,
+                values_flat=values
+            )
             
         except Exception as e:
             raise ChartError(
@@ -92,21 +262,44 @@ class ChartService:
                 f"Technischer Fehler: {str(e)}"
             )
     
-    def _get_unique_dates(self, data_by_symbol: Dict[str, Dict]) -> List[date]:
-        """Get list of unique dates from all symbols"""
-        all_dates = set()
-        for symbol_data in data_by_symbol.values():
-            all_dates.update(symbol_data['dates'])
-        return sorted(list(all_dates))
+    def invalidate_cache(self) -> None:
+        """Drop prepared chart data, e.g. after the underlying prices were reloaded"""
+        self._cache_generation += 1
+        self._prepared_cache.clear()
+    
+    def _get_prepared_data(self, prices: List[PriceView]) -> PriceGroups:
+        """Return prepare_data() result, memoized by a cheap fingerprint of the input"""
+        key = (
+            self._cache_generation,
+            len(prices),
+            prices[0].price_date,
+            prices[-1].price_date,
+            frozenset(price.symbol for price in prices)
+        )
+        cached = self._prepared_cache.get(key)
+        if cached is not None:
+            self._prepared_cache.move_to_end(key)
+            return cached
+        
+        groups = self.prepare_data(prices)
+        self._prepared_cache[key] = groups
+        if len(self._prepared_cache) > self.PREPARED_CACHE_SIZE:
+            self._prepared_cache.popitem(last=False)
+        return groups
+    
+    def _get_unique_dates(self, groups: PriceGroups) -> np.ndarray:
+        """Get sorted unique dates (day numbers) from all symbols"""
+        return np.unique(groups.dates_flat)
     
     def create_chart(
         self,
         prices: List[PriceView],
         config: ChartConfig = None
-    ) -> Figure:
+    ) -> "Figure":
         """
         Create a chart from price data
-        Uses line chart for filtered time series data
+        Uses line/area chart for filtered time series data, BAR compares
+        all assets on the latest date
         
         Args:
             prices: List of price views
@@ -125,12 +318,19 @@ class ChartService:
             # Validate data
             self.validate_data(prices)
             
-            # Prepare data
-            data_by_symbol = self.prepare_data(prices)
-            unique_dates = self._get_unique_dates(data_by_symbol)
+            # Prepare data (reused when the same selection is rendered again)
+            groups = self._get_prepared_data(prices)
             
-            # IMMER Zeitreihen-Diagramm für gefilterte Daten
-            return self._create_time_series_chart(data_by_symbol, config)
+            if config.chart_type == ChartType.BAR:
+                # Bar comparison is rarely used: keep it out of the module import
+                from chart_service_bar import create_comparison_bar_chart
+                
+                # Latest date only: max() instead of sorting all unique dates
+                latest_date = _from_date_number(groups.dates_flat.max())
+                return create_comparison_bar_chart(groups, latest_date, config)
+            
+            # Zeitreihen-Diagramm für gefilterte Daten (LINE/AREA)
+            return self._create_time_series_chart(groups, config)
             
         except (DataNotFoundError, ChartError):
             raise
@@ -140,153 +340,66 @@ class ChartService:
                 f"Technischer Fehler: {str(e)}"
             )
     
-    def _create_comparison_bar_chart(
+    def _create_time_series_chart(
         self,
-        data_by_symbol: Dict[str, Dict],
-        chart_date: date,
+        groups: PriceGroups,
         config: ChartConfig
-    ) -> Figure:
+    ) -> "Figure":
         """
-        Create bar chart comparing asset prices on one date
+        Create time series line/area chart
         
         Args:
-            data_by_symbol: Data grouped by symbol
-            chart_date: The date to display
+            groups: Data grouped by symbol
             config: Chart configuration
             
         Returns:
             Matplotlib Figure
         """
-        # Create figure with better size for many assets
-        fig = Figure(figsize=(14, 8), dpi=config.dpi)
-        ax = fig.add_subplot(111)
+        from matplotlib import dates as mdates
+        from matplotlib.figure import Figure
         
-        # Extract data for the chart
-        symbols = []
-        values = []
-        colors = []
+        self._apply_style()
         
-        # Color palette
-        color_palette = plt.cm.tab20.colors  # 20 distinct colors
+        fig_key = (config.figure_size, config.dpi, config.show_grid, config.show_legend)
+        if (
+            config.chart_type == ChartType.LINE
+            and self._fig is not None
+            and self._fig_key == fig_key
+            and list(self._lines) == groups.symbols.tolist()
+            and not self._fig_in_use
+        ):
+            self._fig_in_use = True
+            return self._update_line_chart(groups, config)
         
-        for idx, (symbol, data) in enumerate(sorted(data_by_symbol.items())):
-            # Get price for this date
-            if chart_date in data['dates']:
-                date_idx = data['dates'].index(chart_date)
-                value = data['values'][date_idx]
-                
-                symbols.append(symbol)
-                values.append(value)
-                colors.append(color_palette[idx % len(color_palette)])
-        
-        # Create bar chart
-        x_pos = np.arange(len(symbols))
-        bars = ax.bar(x_pos, values, color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
-        
-        # Customize chart
-        ax.set_xlabel('Assets', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Kurs (EUR)', fontsize=12, fontweight='bold')
-        ax.set_title(
-            f'Asset-Vergleich am {chart_date.strftime("%d.%m.%Y")}',
-            fontsize=14,
-            fontweight='bold',
-            pad=20
-        )
+        # More than ~2 points per horizontal pixel only collapse into the same pixels
+        max_points = self._max_plot_points(config)
         
-        # Set x-axis
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(symbols, rotation=45, ha='right', fontsize=9)
-        
-        # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            if height >= 1000:
-                label = f'{height:,.0f}'.replace(',', '.')
-            elif height >= 10:
-                label = f'{height:.1f}'.replace('.', ',')
-            else:
-                label = f'{height:.2f}'.replace('.', ',')
-            
-            ax.text(
-                bar.get_x() + bar.get_width()/2.,
-                height,
-                label,
-                ha='center',
-                va='bottom',
-                fontsize=8,
-                rotation=0
-            )
-        
-        # Grid
-        if config.show_grid:
-            ax.grid(True, alpha=0.3, linestyle='--', axis='y')
-            ax.set_axisbelow(True)
-        
-        # Format y-axis with German formatting
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'.replace(',', '.')))
-        
-        # Tight layout
-        fig.tight_layout()
-        
-        return fig
-    
-    def _create_time_series_chart(
-        self,
-        data_by_symbol: Dict[str, Dict],
-        config: ChartConfig
-    ) -> Figure:
-        """
-        Create time series line/area chart
-        
-        Args:
-            data_by_symbol: Data grouped by symbol
-            config: Chart configuration
-            
-        Returns:
-            Matplotlib Figure
-        """
         # Create figure
         fig = Figure(figsize=config.figure_size, dpi=config.dpi)
         ax = fig.add_subplot(111)
         
         # Color palette
-        color_palette = plt.cm.tab20.colors
-
-        # Pick primary currency label from first dataset if available
-        first_symbol = next(iter(data_by_symbol), None)
+        color_palette = _tab20()
+        
         y_currency = "EUR"
-        if first_symbol:
-            y_currency = data_by_symbol[first_symbol].get('currency', 'EUR')
-        
-        # Plot each symbol
-        for idx, (symbol, data) in enumerate(sorted(data_by_symbol.items())):
-            label = f"{symbol}"
-            color = color_palette[idx % len(color_palette)]
-            point_count = len(data['dates'])
-            marker_style = 'o' if point_count <= 40 else None
-            marker_size = 3 if point_count <= 40 else 0
-            
-            if config.chart_type == ChartType.LINE:
-                ax.plot(
-                    data['dates'],
-                    data['values'],
-                    marker=marker_style,
-                    label=label,
-                    linewidth=2.2,
-                    color=color,
-                    markersize=marker_size,
-                    alpha=0.95
-                )
-            
-            elif config.chart_type == ChartType.AREA:
-                ax.fill_between(
-                    data['dates'],
-                    data['values'],
-                    alpha=0.5,
-                    label=label,
-                    color=color
-                )
-                ax.plot(data['dates'], data['values'], linewidth=2, color=color)
+        
+        lines: Dict[str, "Line2D"] = {}
+        
+        legend_handles = None
+        
+        if len(groups) > self.COLLECTION_MIN_SYMBOLS:
+            # Many symbols: one batched collection instead of one artist per symbol
+            legend_handles = self._plot_collections(
+                ax, groups, color_palette, config.chart_type, max_points
+            )
+        else:
+            # Plot each symbol with the renderer specialized for chart type/markers
+            for idx, symbol in enumerate(groups.symbols.tolist()):
+                dates, values = groups.series(idx, max_points)
+                render = _series_renderer(config.chart_type, len(dates) <= 40)
+                line = render(ax, symbol, dates, values, color_palette[idx % len(color_palette)])
+                if line is not None:
+                    lines[symbol] = line
         
         # Configure chart
         ax.set_xlabel('Datum', fontsize=11, fontweight='bold')
@@ -298,21 +411,29 @@ class ChartService:
             ax.set_axisbelow(True)
         
         # Legend - only if not too many items
-        if config.show_legend and len(data_by_symbol) <= 15:
+        if config.show_legend and len(groups) <= 15:
             ax.legend(
+                handles=legend_handles,
                 loc='best',
                 framealpha=0.9,
                 fontsize=9,
-                ncol=2 if len(data_by_symbol) > 8 else 1
+                ncol=2 if len(groups) > 8 else 1
             )
         
         # Format y-axis
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'.replace(',', '.')))
+        ax.yaxis.set_major_formatter(_german_int_formatter_class()())
 
         # Better date axis formatting
-        if len(data_by_symbol) > 0:
-            ax.xaxis.set_major_locator(mdates.AutoDateLocator(minticks=4, maxticks=10))
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%d.%m.%Y'))
+        if len(groups) > 0:
+            locator = mdates.AutoDateLocator(minticks=4, maxticks=10)
+            ax.xaxis.set_major_locator(locator)
+            # Compact labels (year/month/day only where they change), German date order
+            ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(
+                locator,
+                formats=['%Y', '%m.%Y', '%d.%m.', '%d.%m. %H:%M', '%H:%M', '%S.%f'],
+                zero_formats=['', '%Y', '%m.%Y', '%d.%m.', '%H:%M', '%H:%M'],
+                offset_formats=['', '%Y', '%m.%Y', '%d.%m.%Y', '%d.%m.%Y', '%d.%m.%Y %H:%M']
+            ))
         
         # Rotate date labels
         fig.autofmt_xdate(rotation=30, ha='right')
@@ -320,11 +441,94 @@ class ChartService:
         # Tight layout
         fig.tight_layout()
         
+        if config.chart_type == ChartType.LINE:
+            self._fig, self._ax, self._lines, self._fig_key = fig, ax, lines, fig_key
+            self._fig_in_use = True
+        
         return fig
     
+    @staticmethod
+    def _plot_collections(
+        ax,
+        groups: PriceGroups,
+        color_palette,
+        chart_type: ChartType,
+        max_points: Optional[int] = None
+    ) -> List:
+        """
+        Draw all series as a single LineCollection (plus PolyCollection for AREA)
+        
+        Returns:
+            Legend proxy handles, one per symbol
+        """
+        from matplotlib.collections import LineCollection, PolyCollection
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Patch
+        
+        colors = color_palette[np.arange(len(groups)) % len(color_palette)]
+        segments = [np.column_stack(groups.series(idx, max_points)) for idx in range(len(groups))]
+        symbols = groups.symbols.tolist()
+        
+        if chart_type == ChartType.AREA:
+            polygons = [
+                np.vstack(((segment[0, 0], 0.0), segment, (segment[-1, 0], 0.0)))
+                for segment in segments
+            ]
+            ax.add_collection(PolyCollection(polygons, facecolors=colors, edgecolors='none', alpha=0.5))
+            ax.add_collection(LineCollection(segments, colors=colors, linewidths=2))
+            handles = [
+                Patch(facecolor=color, alpha=0.5, label=symbol)
+                for symbol, color in zip(symbols, colors)
+            ]
+        else:
+            ax.add_collection(LineCollection(segments, colors=colors, linewidths=2.2, alpha=0.95))
+            handles = [
+                Line2D([], [], color=color, linewidth=2.2, alpha=0.95, label=symbol)
+                for symbol, color in zip(symbols, colors)
+            ]
+        
+        ax.autoscale_view()
+        return handles
+    
+    @staticmethod
+    def _max_plot_points(config: ChartConfig) -> int:
+        """Point budget per series: two points per horizontal pixel of the figure"""
+        return int(config.figure_size[0] * config.dpi * 2)
+    
+    def release_figure(self, fig: "Figure") -> None:
+        """Mark a figure as no longer shown so the next line chart may reuse it"""
+        if fig is self._fig:
+            self._fig_in_use = False
+    
+    def _update_line_chart(self, groups: PriceGroups, config: ChartConfig) -> "Figure":
+        """Redraw the cached line chart in place for the same set of symbols"""
+        max_points = self._max_plot_points(config)
+        for idx, line in enumerate(self._lines.values()):
+            dates, values = groups.series(idx, max_points)
+            line.set_data(dates, values)
+            few_points = len(dates) <= 40
+            line.set_marker('o' if few_points else '')
+            line.set_markersize(3 if few_points else 0)
+        
+        self._ax.set_title(config.title, fontsize=14, fontweight='bold', pad=20)
+        if self._ax.get_legend() is not None:
+            # Legend handles copy the line style, rebuild them for the new markers
+            self._ax.legend(
+                loc='best',
+                framealpha=0.9,
+                fontsize=9,
+                ncol=2 if len(groups) > 8 else 1
+            )
+        self._ax.relim()
+        self._ax.autoscale_view()
+        # The previous window's canvas resized the figure to its own size
+        self._fig.set_size_inches(config.figure_size, forward=False)
+        self._fig.tight_layout()
+        return self._fig
+    
     def save_chart(
         self,
-        fig: Figure,
+        fig: "Figure",
         file_path: Path,
         dpi: int = 150
     ) -> None:
@@ -351,11 +555,14 @@ class ChartService:
 class ChartWindow(tk.Toplevel):
     """Window for displaying charts"""
     
+    RESIZE_DEBOUNCE_MS = 150
+    
     def __init__(
         self,
         parent: tk.Tk,
-        fig: Figure,
-        title: str = "Diagramm"
+        fig: "Figure",
+        title: str = "Diagramm",
+        on_close: Optional[Callable[["Figure"], None]] = None
     ):
         super().__init__(parent)
         
@@ -383,9 +590,12 @@ class ChartWindow(tk.Toplevel):
             command=self.destroy
         ).pack(side=tk.RIGHT, padx=5)
         
+        # Tk canvas backend is only needed once a chart window is opened
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
         # Create canvas
         self.canvas = FigureCanvasTkAgg(fig, master=self)
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().pack(
             side=tk.TOP,
             fill=tk.BOTH,
@@ -394,15 +604,52 @@ class ChartWindow(tk.Toplevel):
             pady=15
         )
         
-        # Store figure for saving
+        # Re-render only once the window size settles instead of on every <Configure>.
+        # Binding without add="+" deliberately replaces FigureCanvasTkAgg's own
+        # <Configure> handler, which would re-render on every event.
+        self._resize_job: Optional[str] = None
+        self._initial_size_set = False
+        self.canvas.get_tk_widget().bind("<Configure>", self._on_canvas_configure)
+        
+        # Store figure for saving; on_close hands it back to its owner
         self.fig = fig
+        self._on_close = on_close
         
         # Center window
         self.update_idletasks()
         x = (self.winfo_screenwidth() // 2) - (1400 // 2)
         y = (self.winfo_screenheight() // 2) - (800 // 2)
         self.geometry(f"1400x800+{x}+{y}")
+
+    def _on_canvas_configure(self, event: tk.Event) -> None:
+        """Debounce canvas resizes: the full Agg re-render runs after the last event"""
+        if not self._initial_size_set:
+            self._initial_size_set = True
+            self.canvas.resize(event)
+            return
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(self.RESIZE_DEBOUNCE_MS, self._apply_resize)
+    
+    def _apply_resize(self) -> None:
+        """Resize the figure to the canvas widget's current size"""
+        self._resize_job = None
+        widget = self.canvas.get_tk_widget()
+        event = tk.Event()
+        event.width = widget.winfo_width()
+        event.height = widget.winfo_height()
+        self.canvas.resize(event)
     
+    def destroy(self) -> None:
+        """Close window and release the figure to its owner"""
+        if getattr(self, '_resize_job', None) is not None:
+            self.after_cancel(self._resize_job)
+        on_close = getattr(self, '_on_close', None)
+        if on_close is not None:
+            self._on_close = None
+            on_close(self.fig)
+        super().destroy()
+
     def _save_chart(self) -> None:
         """Save chart to file"""
         file_path = filedialog.asksaveasfilename(
@@ -0,0 +1,122 @@
+"""
+Bar chart comparing asset prices on one date
+
+Split from chart_service because it is only needed for ChartType.BAR;
+ChartService.create_chart imports it on demand.
+"""
+from datetime import date
+from typing import Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from chart_service import (
+    ChartService,
+    PriceGroups,
+    _german_int_formatter_class,
+    _tab20,
+    _to_date_numbers,
+)
+from models import ChartConfig
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+# Bar labels: < 10 -> "1,23", < 1000 -> "12,3", else "1.234" (German separators)
+_BAR_LABEL_BINS = (10, 1000)
+_BAR_LABEL_FORMATS = (
+    lambda value: f'{value:.2f}'.replace('.', ','),
+    lambda value: f'{value:.1f}'.replace('.', ','),
+    lambda value: f'{value:,.0f}'.replace(',', '.'),
+)
+
+
+def bar_lookup(groups: PriceGroups, chart_date: date) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the value on chart_date for each symbol via binary search
+    
+    Returns:
+        Parallel arrays (symbol index, value) for symbols that have a
+        price on chart_date
+    """
+    target = _to_date_numbers([chart_date])[0]
+    offsets = groups.offsets
+    symbol_idx = []
+    positions = []
+    for idx in range(len(groups)):
+        start, end = offsets[idx], offsets[idx + 1]
+        pos = start + int(np.searchsorted(groups.dates_flat[start:end], target))
+        if pos < end and groups.dates_flat[pos] == target:
+            symbol_idx.append(idx)
+            positions.append(pos)
+    return np.array(symbol_idx, dtype=np.intp), groups.values_flat[np.array(positions, dtype=np.intp)]
+
+
+def create_comparison_bar_chart(
+    groups: PriceGroups,
+    chart_date: date,
+    config: ChartConfig
+) -> "Figure":
+    """
+    Create bar chart comparing asset prices on one date
+    
+    Args:
+        groups: Data grouped by symbol
+        chart_date: The date to display
+        config: Chart configuration
+    
+    Returns:
+        Matplotlib Figure
+    """
+    from matplotlib.figure import Figure
+    
+    ChartService._apply_style()
+    
+    # Create figure with better size for many assets
+    fig = Figure(figsize=(14, 8), dpi=config.dpi)
+    ax = fig.add_subplot(111)
+    
+    # Extract data for the chart
+    symbol_idx, values = bar_lookup(groups, chart_date)
+    symbols = groups.symbols[symbol_idx].tolist()
+    palette = _tab20()
+    colors = palette[symbol_idx % len(palette)]
+    
+    # Create bar chart
+    x_pos = np.arange(len(symbols))
+    bars = ax.bar(x_pos, values, color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
+    
+    # Customize chart
+    ax.set_xlabel('Assets', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Kurs (EUR)', fontsize=12, fontweight='bold')
+    ax.set_title(
+        f'Asset-Vergleich am {chart_date.strftime("%d.%m.%Y")}',
+        fontsize=14,
+        fontweight='bold',
+        pad=20
+    )
+    
+    # Set x-axis
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(symbols, rotation=45, ha='right', fontsize=9)
+    
+    # Add value labels on top of bars (format chosen per magnitude bin)
+    label_bins = np.digitize(values, _BAR_LABEL_BINS)
+    labels = [
+        _BAR_LABEL_FORMATS[label_bin](value)
+        for label_bin, value in zip(label_bins.tolist(), values.tolist())
+    ]
+    ax.bar_label(bars, labels=labels, fontsize=8)
+    
+    # Grid
+    if config.show_grid:
+        ax.grid(True, alpha=0.3, linestyle='--', axis='y')
+        ax.set_axisbelow(True)
+    
+    # Format y-axis with German formatting
+    ax.yaxis.set_major_formatter(_german_int_formatter_class()())
+    
+    # Tight layout
+    fig.tight_layout()
+    
+    return fig
@@ -1,7 +1,11 @@
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 
-@dataclass
+_HERE = Path(__file__).parent
+
+
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration"""
     db_path: Path
@@ -10,10 +14,12 @@ class AppConfig:
     window_height: int = 720
     default_currency: str = "EUR"
     date_format: str = "%Y-%m-%d"
-    backup_dir: Path = Path(__file__).parent / "backups"
+    backup_dir: Path = _HERE / "backups"
     backup_retention_days: int = 30
     enable_auto_backup: bool = True
-    theme_config_file: Path = Path(__file__).parent / "config" / "theme.json"
+    # Full integrity_check on database import instead of the faster quick_check
+    deep_import_check: bool = False
+    theme_config_file: Path = _HERE / "config" / "theme.json"
     default_theme: str = "light"
     
     # Window settings
@@ -22,17 +28,15 @@ class AppConfig:
     resizable: bool = True
     
     # Icon paths
-    assets_dir: Path = Path(__file__).parent / "assets"
+    assets_dir: Path = _HERE / "assets"
     icons_dir: Path = assets_dir / "icons"
     
     @classmethod
     def from_env(cls) -> "AppConfig":
         """Load configuration from environment or defaults"""
-        db_path = Path(__file__).parent / "portfolio.db"
-        backup_dir = Path(__file__).parent / "backups"
-        theme_config_file = Path(__file__).parent / "config" / "theme.json"
-        return cls(db_path=db_path, backup_dir=backup_dir, theme_config_file=theme_config_file)
+        return cls(db_path=_HERE / "portfolio.db")
     
+    @lru_cache(maxsize=64)
     def get_icon_path(self, icon_name: str) -> Path:
         """Get full path to icon file"""
         return self.icons_dir / icon_name
@@ -40,6 +44,8 @@ class AppConfig:
 
 class Constants:
     """Application constants"""
+    __slots__ = ()
+    
     SOURCE_MANUAL_GUI = "manual_gui"
     PADDING = 10
     DATE_LENGTH = 10
@@ -0,0 +1,27 @@
+"""Conversions for values read back from the database"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+from typing import Optional, Union
+
+
+@lru_cache(maxsize=1024, typed=True)
+def to_decimal(value: float) -> Decimal:
+    """Convert a stored REAL to Decimal; prices and amounts repeat, so memoize."""
+    return Decimal(str(value))
+
+
+def parse_timestamp(value: Union[str, int, None]) -> Optional[datetime]:
+    """Parse a stored timestamp, fast path for SQLite's 'YYYY-MM-DD HH:MM:SS'."""
+    if not value:
+        return None
+    if isinstance(value, int):
+        # created_at as UTC epoch seconds, naive like the text form
+        return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+    if len(value) == 19 and value[10] in " T":
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+        )
+    return datetime.fromisoformat(value)
@@ -1,8 +1,9 @@
 import sqlite3
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Dict
 from datetime import date, timedelta
 from contextlib import contextmanager
+from functools import lru_cache
 
 from models import (
     Asset, Price, PriceView, PriceFilter,
@@ -11,8 +12,252 @@ from models import (
 from exceptions import DatabaseError, DataNotFoundError
 
 
+# Portfolio tables and indexes, created on connect. created_at holds UTC epoch
+# seconds; databases created before keep their CURRENT_TIMESTAMP text.
+_PORTFOLIO_SCHEMA_SQL = """
+    -- Portfolio transactions table
+    CREATE TABLE IF NOT EXISTS portfolio_transaction (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        asset_id INTEGER NOT NULL,
+        transaction_type TEXT NOT NULL,
+        quantity REAL NOT NULL CHECK(quantity > 0),
+        price REAL NOT NULL CHECK(price > 0),
+        currency TEXT NOT NULL CHECK(length(currency) = 3),
+        transaction_date TEXT NOT NULL,
+        notes TEXT,
+        created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        FOREIGN KEY (asset_id) REFERENCES asset(id)
+    );
+
+    -- Index for faster queries
+    CREATE INDEX IF NOT EXISTS idx_portfolio_asset_date
+    ON portfolio_transaction(asset_id, transaction_date);
+
+    CREATE TABLE IF NOT EXISTS dividend (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        asset_id INTEGER NOT NULL,
+        payment_date TEXT NOT NULL,
+        amount REAL NOT NULL CHECK(amount > 0),
+        currency TEXT NOT NULL DEFAULT 'EUR' CHECK(length(currency) = 3),
+        tax_withheld REAL DEFAULT 0 CHECK(tax_withheld >= 0),
+        dividend_type TEXT DEFAULT 'regular' CHECK(dividend_type IN ('regular', 'special', 'capital_return')),
+        notes TEXT,
+        created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        FOREIGN KEY (asset_id) REFERENCES asset(id) ON DELETE CASCADE,
+        UNIQUE(asset_id, payment_date)
+    );
+
+    -- UNIQUE(asset_id, payment_date) already indexes asset_id lookups
+    DROP INDEX IF EXISTS idx_dividend_asset;
+
+    CREATE INDEX IF NOT EXISTS idx_dividend_date
+    ON dividend(payment_date);
+
+    CREATE TABLE IF NOT EXISTS price_alert (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        asset_id INTEGER NOT NULL,
+        alert_type TEXT NOT NULL CHECK(alert_type IN ('above', 'below', 'change_percent')),
+        threshold_value REAL NOT NULL,
+        currency TEXT NOT NULL DEFAULT 'EUR' CHECK(length(currency) = 3),
+        active INTEGER DEFAULT 1,
+        triggered INTEGER DEFAULT 0,
+        triggered_at TEXT,
+        notification_sent INTEGER DEFAULT 0,
+        notes TEXT,
+        created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        FOREIGN KEY (asset_id) REFERENCES asset(id) ON DELETE CASCADE
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_price_alert_asset
+    ON price_alert(asset_id);
+
+    CREATE INDEX IF NOT EXISTS idx_price_alert_active
+    ON price_alert(active, triggered);
+"""
+
+# Hot statements as module constants: sqlite3 keeps compiled statements per
+# connection keyed by SQL text, so these are prepared once and then reused
+_SAVE_PRICE_SQL = """
+    INSERT INTO price (asset_id, price_date, close, currency, source)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(asset_id, price_date) DO UPDATE SET
+        close = excluded.close,
+        currency = excluded.currency,
+        source = excluded.source
+"""
+
+_SAVE_TRANSACTION_SQL = """
+    INSERT INTO portfolio_transaction
+    (asset_id, transaction_type, quantity, price, currency, transaction_date, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Latest close per held asset in one pass instead of one query per position
+_LATEST_PRICES_SQL = """
+    WITH latest AS (
+        SELECT asset_id, close, price_date,
+               ROW_NUMBER() OVER (PARTITION BY asset_id ORDER BY price_date DESC) AS rn
+        FROM price
+        WHERE asset_id IN (SELECT DISTINCT asset_id FROM portfolio_transaction)
+    )
+    SELECT asset_id, close, price_date
+    FROM latest
+    WHERE rn = 1
+"""
+
+_TRANSACTIONS_FOR_ASSET_SQL = """
+    SELECT id, asset_id, transaction_type, quantity, price,
+           currency, transaction_date, notes
+    FROM portfolio_transaction
+    WHERE asset_id = ?
+    ORDER BY transaction_date DESC
+"""
+
+_ACTIVE_ASSETS_SQL = """
+    SELECT id, symbol, name, active
+    FROM asset
+    WHERE active = 1
+    ORDER BY symbol
+"""
+
+_PORTFOLIO_POSITIONS_SQL = """
+    WITH agg AS (
+        SELECT
+            pt.asset_id,
+            pt.currency,
+            SUM(CASE
+                WHEN pt.transaction_type = 'buy' THEN pt.quantity
+                WHEN pt.transaction_type = 'sell' THEN -pt.quantity
+            END) AS total_quantity,
+            SUM(CASE
+                WHEN pt.transaction_type = 'buy' THEN pt.quantity * pt.price
+                WHEN pt.transaction_type = 'sell' THEN -pt.quantity * pt.price
+            END) AS total_cost,
+            MIN(pt.transaction_date) AS first_buy_date,
+            MAX(pt.transaction_date) AS last_transaction_date
+        FROM portfolio_transaction pt
+        GROUP BY pt.asset_id, pt.currency
+        HAVING total_quantity > 0
+    )
+    SELECT
+        a.id,
+        a.symbol,
+        a.name,
+        agg.total_quantity,
+        agg.total_cost / agg.total_quantity AS avg_price,
+        agg.currency,
+        agg.first_buy_date,
+        agg.last_transaction_date
+    FROM agg
+    JOIN asset a ON a.id = agg.asset_id
+    ORDER BY a.symbol
+"""
+
+_ALL_TRANSACTIONS_SQL = """
+    SELECT id, asset_id, transaction_type, quantity, price,
+           currency, transaction_date, notes
+    FROM portfolio_transaction
+    ORDER BY transaction_date DESC
+"""
+
+_PRICE_DATES_IN_RANGE_SQL = """
+    SELECT DISTINCT price_date
+    FROM price
+    WHERE price_date BETWEEN ? AND ?
+    ORDER BY price_date
+"""
+
+_ASSET_BY_SYMBOL_SQL = """
+    SELECT id, symbol, name, active
+    FROM asset
+    WHERE symbol = ?
+"""
+
+_DISTINCT_CURRENCIES_SQL = "SELECT DISTINCT currency FROM price ORDER BY currency"
+
+
+def _is_currency_code(value: Optional[str]) -> bool:
+    """Three ASCII letters, checked without allocating a stripped copy"""
+    return bool(value) and len(value) == 3 and value.isascii() and value.isalpha()
+
+
+# Imports and filters write the same dates over and over; reuse the strings
+@lru_cache(maxsize=1024)
+def _iso(value: date) -> str:
+    return value.isoformat()
+
+
+# Price and transaction rows repeat the same few thousand dates; dates are
+# immutable, so parsed instances can be shared between rows
+@lru_cache(maxsize=4096)
+def _iso_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+# Row factories build model objects while SQLite steps through the result,
+# so a fetch allocates no intermediate tuple list
+def _price_view_factory(cursor: sqlite3.Cursor, row: tuple) -> PriceView:
+    return PriceView(
+        symbol=row[0], name=row[1], close=float(row[2]),
+        currency=row[3], source=row[4],
+        price_date=_iso_date(row[5]),
+        change_percent=row[6]
+    )
+
+
+def _transaction_factory(cursor: sqlite3.Cursor, row: tuple) -> Transaction:
+    return Transaction(
+        id=row[0],
+        asset_id=row[1],
+        transaction_type=TransactionType(row[2]),
+        quantity=float(row[3]),
+        price=float(row[4]),
+        currency=row[5],
+        transaction_date=_iso_date(row[6]),
+        notes=row[7]
+    )
+
+
+def _position_factory(cursor: sqlite3.Cursor, row: tuple) -> PortfolioPosition:
+    return PortfolioPosition(
+        id=row[0],
+        asset_id=row[0],
+        symbol=row[1],
+        name=row[2],
+        quantity=float(row[3]),
+        average_buy_price=float(row[4]) if row[4] else 0.0,
+        currency=row[5],
+        first_buy_date=_iso_date(row[6]),
+        last_transaction_date=_iso_date(row[7])
+    )
+
+
 class PriceRepository:
     """Repository for price and asset data access"""
+
+    # Compiled-statement cache per connection (sqlite3 default: 128)
+    _STATEMENT_CACHE_SIZE = 256
+    # Rows per executemany() call in the bulk save methods
+    BULK_CHUNK_SIZE = 10_000
+    
+    # Indexes on the externally created price table; ANALYZE runs once after
+    # any of them is first created so the planner picks them up
+    _PRICE_INDEXES = (
+        ("idx_price_asset_date_close", "price(asset_id, price_date DESC, close)"),
+        ("idx_price_date", "price(price_date)"),
+    )
+    
+    # WAL + NORMAL: commits append to the log instead of syncing twice;
+    # 64 MB page cache and 256 MB mmap keep repeated price scans in memory.
+    # journal_mode is set separately because its result must be checked.
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA cache_size = -65536",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA busy_timeout = 5000",
+        "PRAGMA journal_size_limit = 6144000",
+    )
     
     def __init__(self, db_path: Path):
         if not db_path.exists():
@@ -23,11 +268,25 @@ class PriceRepository:
         
         self._db_path = db_path
         self._connection: Optional[sqlite3.Connection] = None
+        self._journal_mode: Optional[str] = None
+        # The app never writes the asset table, so found assets are cached
+        # per connection; Asset is frozen, so sharing instances is safe.
+        self._asset_cache_by_symbol: Dict[str, Asset] = {}
+    
+    @property
+    def journal_mode(self) -> Optional[str]:
+        """Journal mode actually in effect ('wal' unless SQLite refused it)"""
+        return self._journal_mode
     
     def connect(self) -> None:
         """Establish database connection"""
+        self.invalidate_asset_cache()
         try:
-            self._connection = sqlite3.connect(self._db_path)
+            self._connection = sqlite3.connect(
+                self._db_path,
+                cached_statements=self._STATEMENT_CACHE_SIZE
+            )
+            self._configure_connection()
             self._enable_foreign_keys()
             self._create_portfolio_tables()
         except sqlite3.Error as e:
@@ -46,6 +305,44 @@ class PriceRepository:
         except sqlite3.Error as e:
             raise DatabaseError("SQL-Ausführung fehlgeschlagen", str(e))
 
+    def executemany(self, query: str, params_seq: Iterable[tuple]) -> sqlite3.Cursor:
+        """Execute a SQL query once per parameter set on the active connection."""
+        if not self._connection:
+            raise DatabaseError("Keine aktive Datenbankverbindung")
+
+        try:
+            return self._connection.executemany(query, params_seq)
+        except sqlite3.Error as e:
+            raise DatabaseError("SQL-Ausführung fehlgeschlagen", str(e))
+
+    @contextmanager
+    def cursor(self):
+        """Yield one cursor for a group of related statements and close it afterwards"""
+        if not self._connection:
+            raise DatabaseError("Keine aktive Datenbankverbindung")
+        
+        cursor = self._connection.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+    def _fetch_models(self, factory, query: str, params: Iterable = ()) -> list:
+        """Run a query on a dedicated cursor that maps rows through factory"""
+        with self.cursor() as cursor:
+            cursor.row_factory = factory
+            return cursor.execute(query, params).fetchall()
+
+    def _configure_connection(self) -> None:
+        """Apply journal and cache PRAGMAs for the read-heavy desktop workload"""
+        # SQLite answers with the resulting mode; it stays e.g. 'delete' on
+        # file systems without shared memory support, which is not an error
+        result = self.execute("PRAGMA journal_mode = WAL").fetchone()
+        self._journal_mode = str(result[0]).lower() if result else None
+        
+        for pragma in self._CONNECTION_PRAGMAS:
+            self.execute(pragma)
+
     def _enable_foreign_keys(self) -> None:
         """Enable foreign key constraints"""
         self.execute("PRAGMA foreign_keys = ON")
@@ -60,80 +357,25 @@ class PriceRepository:
     def _create_portfolio_tables(self) -> None:
         """Create portfolio tables if they don't exist"""
         try:
-            # Portfolio transactions table
-            self._connection.execute("""
-                CREATE TABLE IF NOT EXISTS portfolio_transaction (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    asset_id INTEGER NOT NULL,
-                    transaction_type TEXT NOT NULL,
-                    quantity REAL NOT NULL CHECK(quantity > 0),
-                    price REAL NOT NULL CHECK(price > 0),
-                    currency TEXT NOT NULL CHECK(length(currency) = 3),
-                    transaction_date TEXT NOT NULL,
-                    notes TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (asset_id) REFERENCES asset(id)
+            # executescript() parses the whole DDL batch in one call
+            self._connection.executescript(_PORTFOLIO_SCHEMA_SQL)
+            
+            # Covering index for "latest close per asset" lookups, plus a
+            # date index for the DISTINCT date scan of the value history
+            existing_indexes = {
+                row[0] for row in self._connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'price'"
                 )
-            """)
+            }
             
-            # Index for faster queries
-            self._connection.execute("""
-                CREATE INDEX IF NOT EXISTS idx_portfolio_asset_date 
-                ON portfolio_transaction(asset_id, transaction_date)
-            """)
-
-            self._connection.execute("""
-                CREATE TABLE IF NOT EXISTS dividend (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    asset_id INTEGER NOT NULL,
-                    payment_date TEXT NOT NULL,
-                    amount REAL NOT NULL CHECK(amount > 0),
-                    currency TEXT NOT NULL DEFAULT 'EUR' CHECK(length(currency) = 3),
-                    tax_withheld REAL DEFAULT 0 CHECK(tax_withheld >= 0),
-                    dividend_type TEXT DEFAULT 'regular' CHECK(dividend_type IN ('regular', 'special', 'capital_return')),
-                    notes TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (asset_id) REFERENCES asset(id) ON DELETE CASCADE,
-                    UNIQUE(asset_id, payment_date)
-                )
-            """)
-
-            self._connection.execute("""
-                CREATE INDEX IF NOT EXISTS idx_dividend_asset
-                ON dividend(asset_id)
-            """)
-
-            self._connection.execute("""
-                CREATE INDEX IF NOT EXISTS idx_dividend_date
-                ON dividend(payment_date)
-            """)
-
-            self._connection.execute("""
-                CREATE TABLE IF NOT EXISTS price_alert (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    asset_id INTEGER NOT NULL,
-                    alert_type TEXT NOT NULL CHECK(alert_type IN ('above', 'below', 'change_percent')),
-                    threshold_value REAL NOT NULL,
-                    currency TEXT NOT NULL DEFAULT 'EUR' CHECK(length(currency) = 3),
-                    active INTEGER DEFAULT 1,
-                    triggered INTEGER DEFAULT 0,
-                    triggered_at TEXT,
-                    notification_sent INTEGER DEFAULT 0,
-                    notes TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (asset_id) REFERENCES asset(id) ON DELETE CASCADE
-                )
-            """)
-
-            self._connection.execute("""
-                CREATE INDEX IF NOT EXISTS idx_price_alert_asset
-                ON price_alert(asset_id)
-            """)
-
-            self._connection.execute("""
-                CREATE INDEX IF NOT EXISTS idx_price_alert_active
-                ON price_alert(active, triggered)
-            """)
+            created_index = False
+            for name, definition in self._PRICE_INDEXES:
+                if name not in existing_indexes:
+                    self._connection.execute(f"CREATE INDEX {name} ON {definition}")
+                    created_index = True
+            
+            if created_index:
+                self._connection.execute("ANALYZE price")
             
             self._connection.commit()
         except sqlite3.Error as e:
@@ -146,8 +388,11 @@ class PriceRepository:
         """Close database connection"""
         if self._connection:
             try:
+                # Refresh planner statistics for tables whose shape changed
+                self._connection.execute("PRAGMA optimize")
                 self._connection.close()
                 self._connection = None
+                self.invalidate_asset_cache()
             except sqlite3.Error as e:
                 raise DatabaseError(
                     "Fehler beim Schließen der Datenbankverbindung",
@@ -178,7 +423,9 @@ class PriceRepository:
         """Start a new transaction"""
         if not self._connection:
             raise DatabaseError("Keine aktive Datenbankverbindung")
-        self._connection.execute("BEGIN")
+        # Take the write lock up front: a deferred BEGIN that later upgrades
+        # fails with SQLITE_BUSY instead of waiting out busy_timeout
+        self._connection.execute("BEGIN IMMEDIATE")
 
     def commit_transaction(self) -> None:
         """Commit current transaction"""
@@ -216,56 +463,50 @@ class PriceRepository:
         """Check for foreign key violations"""
         violations: List[str] = []
 
+        # One compound scan instead of four round trips. PRAGMA foreign_key_check
+        # would miss the price table, which is created without a declared FK.
         result = self.execute("""
-            SELECT pt.id, pt.asset_id
+            SELECT 'portfolio_transaction', pt.id, pt.asset_id, NULL
             FROM portfolio_transaction pt
             LEFT JOIN asset a ON pt.asset_id = a.id
             WHERE a.id IS NULL
-        """).fetchall()
-
-        for row in result:
-            violations.append(
-                f"portfolio_transaction.id={row[0]} verweist auf "
-                f"nicht existierendes asset.id={row[1]}"
-            )
-
-        result = self.execute("""
-            SELECT p.asset_id, p.price_date
+            UNION ALL
+            SELECT 'price', NULL, p.asset_id, p.price_date
             FROM price p
             LEFT JOIN asset a ON p.asset_id = a.id
             WHERE a.id IS NULL
-        """).fetchall()
-
-        for row in result:
-            violations.append(
-                f"price für asset.id={row[0]} am {row[1]} verweist auf "
-                f"nicht existierendes Asset"
-            )
-
-        result = self.execute("""
-            SELECT d.id, d.asset_id, d.payment_date
+            UNION ALL
+            SELECT 'dividend', d.id, d.asset_id, d.payment_date
             FROM dividend d
             LEFT JOIN asset a ON d.asset_id = a.id
             WHERE a.id IS NULL
-        """).fetchall()
-
-        for row in result:
-            violations.append(
-                f"dividend.id={row[0]} (asset.id={row[1]}, {row[2]}) verweist auf "
-                f"nicht existierendes Asset"
-            )
-
-        result = self.execute("""
-            SELECT pa.id, pa.asset_id
+            UNION ALL
+            SELECT 'price_alert', pa.id, pa.asset_id, NULL
             FROM price_alert pa
             LEFT JOIN asset a ON pa.asset_id = a.id
             WHERE a.id IS NULL
         """).fetchall()
 
-        for row in result:
-            violations.append(
-                f"price_alert.id={row[0]} verweist auf nicht existierendes asset.id={row[1]}"
-            )
+        for table, row_id, asset_id, row_date in result:
+            if table == 'portfolio_transaction':
+                violations.append(
+                    f"portfolio_transaction.id={row_id} verweist auf "
+                    f"nicht existierendes asset.id={asset_id}"
+                )
+            elif table == 'price':
+                violations.append(
+                    f"price für asset.id={asset_id} am {row_date} verweist auf "
+                    f"nicht existierendes Asset"
+                )
+            elif table == 'dividend':
+                violations.append(
+                    f"dividend.id={row_id} (asset.id={asset_id}, {row_date}) verweist auf "
+                    f"nicht existierendes Asset"
+                )
+            else:
+                violations.append(
+                    f"price_alert.id={row_id} verweist auf nicht existierendes asset.id={asset_id}"
+                )
 
         return violations
 
@@ -273,30 +514,13 @@ class PriceRepository:
         """Remove orphaned data (foreign key violations)."""
         deleted: Dict[str, int] = {}
 
-        with self.transaction():
-            result = self.execute("""
-                DELETE FROM portfolio_transaction
-                WHERE asset_id NOT IN (SELECT id FROM asset)
-            """)
-            deleted['portfolio_transaction'] = result.rowcount
-
-            result = self.execute("""
-                DELETE FROM price
-                WHERE asset_id NOT IN (SELECT id FROM asset)
-            """)
-            deleted['price'] = result.rowcount
-
-            result = self.execute("""
-                DELETE FROM dividend
-                WHERE asset_id NOT IN (SELECT id FROM asset)
-            """)
-            deleted['dividend'] = result.rowcount
-
-            result = self.execute("""
-                DELETE FROM price_alert
-                WHERE asset_id NOT IN (SELECT id FROM asset)
-            """)
-            deleted['price_alert'] = result.rowcount
+        with self.transaction(), self.cursor() as cursor:
+            for table in ('portfolio_transaction', 'price', 'dividend', 'price_alert'):
+                cursor.execute(f"""
+                    DELETE FROM {table}
+                    WHERE asset_id NOT IN (SELECT id FROM asset)
+                """)
+                deleted[table] = cursor.rowcount
 
         return deleted
     
@@ -308,13 +532,7 @@ class PriceRepository:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
         try:
-            query = """
-                SELECT id, symbol, name, active
-                FROM asset
-                WHERE active = 1
-                ORDER BY symbol
-            """
-            rows = self._connection.execute(query).fetchall()
+            rows = self._connection.execute(_ACTIVE_ASSETS_SQL).fetchall()
             
             return [
                 Asset(id=row[0], symbol=row[1], name=row[2], active=bool(row[3]))
@@ -328,31 +546,50 @@ class PriceRepository:
         if not self._connection:
             raise DatabaseError("Keine aktive Datenbankverbindung")
 
+        self._validate_price(price)
+        
+        # A single upsert is atomic on its own; no explicit BEGIN needed
+        try:
+            self._connection.execute(
+                _SAVE_PRICE_SQL,
+                (price.asset_id, _iso(price.price_date), 
+                 price.close, price.currency, price.source)
+            )
+            self._connection.commit()
+        except sqlite3.Error as e:
+            self._connection.rollback()
+            raise DatabaseError("Fehler beim Speichern des Kurses", f"SQL-Fehler: {str(e)}")
+    
+    def save_prices_bulk(self, prices: Iterable[Price]) -> int:
+        """Insert or update many price entries in a single transaction"""
+        if not self._connection:
+            raise DatabaseError("Keine aktive Datenbankverbindung")
+        
+        # Validate everything up front so a bad row cannot leave a partial import
+        prices = list(prices)
+        for price in prices:
+            self._validate_price(price)
+        
+        with self.transaction():
+            for start in range(0, len(prices), self.BULK_CHUNK_SIZE):
+                self._connection.executemany(
+                    _SAVE_PRICE_SQL,
+                    (
+                        (p.asset_id, _iso(p.price_date), p.close, p.currency, p.source)
+                        for p in prices[start:start + self.BULK_CHUNK_SIZE]
+                    )
+                )
+        return len(prices)
+    
+    @staticmethod
+    def _validate_price(price: Price) -> None:
+        """Reject prices that must not reach the database"""
         if price.asset_id <= 0:
             raise DatabaseError("Ungültiges Asset", f"Asset ID {price.asset_id} ist ungültig.")
         if price.close <= 0:
             raise DatabaseError("Ungültiger Kurs", "Kurs muss größer als 0 sein.")
-        if not price.currency or len(price.currency.strip()) != 3:
+        if not _is_currency_code(price.currency):
             raise DatabaseError("Ungültige Währung", "Währung muss genau 3 Buchstaben haben.")
-        
-        query = """
-            INSERT INTO price (asset_id, price_date, close, currency, source)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(asset_id, price_date) DO UPDATE SET
-                close = excluded.close,
-                currency = excluded.currency,
-                source = excluded.source
-        """
-        
-        try:
-            with self.transaction():
-                self._connection.execute(
-                    query,
-                    (price.asset_id, price.price_date.isoformat(), 
-                     price.close, price.currency, price.source)
-                )
-        except DatabaseError:
-            raise
     
     def delete_price(self, symbol: str, price_date: date) -> None:
         """Delete a specific price entry"""
@@ -360,16 +597,16 @@ class PriceRepository:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
         try:
-            with self.transaction():
+            with self.transaction(), self.cursor() as cursor:
                 asset_query = "SELECT id FROM asset WHERE symbol = ?"
-                result = self._connection.execute(asset_query, (symbol,)).fetchone()
+                result = cursor.execute(asset_query, (symbol,)).fetchone()
                 
                 if not result:
                     raise DatabaseError("Asset nicht gefunden", f"Symbol: {symbol}")
                 
                 asset_id = result[0]
                 delete_query = "DELETE FROM price WHERE asset_id = ? AND price_date = ?"
-                cursor = self._connection.execute(delete_query, (asset_id, price_date.isoformat()))
+                cursor.execute(delete_query, (asset_id, _iso(price_date)))
                 
                 if cursor.rowcount == 0:
                     raise DatabaseError(
@@ -391,43 +628,27 @@ class PriceRepository:
         except Exception as e:
             raise DatabaseError("Fehler beim Leeren der Datenbank", str(e))
     
-    def _calculate_price_changes(self, prices: List[PriceView]) -> List[PriceView]:
-        """Calculate percentage changes for price list"""
-        if not prices:
-            return prices
-        
-        # Group by symbol
-        by_symbol: Dict[str, List[PriceView]] = {}
-        for price in prices:
-            if price.symbol not in by_symbol:
-                by_symbol[price.symbol] = []
-            by_symbol[price.symbol].append(price)
-        
-        # Sort by date and calculate changes
-        for symbol in by_symbol:
-            symbol_prices = sorted(by_symbol[symbol], key=lambda p: p.price_date)
-            
-            for i, price in enumerate(symbol_prices):
-                if i == 0:
-                    price.change_percent = None
-                else:
-                    prev_price = symbol_prices[i - 1]
-                    if prev_price.close > 0:
-                        change = ((price.close - prev_price.close) / prev_price.close) * 100
-                        price.change_percent = change
-                    else:
-                        price.change_percent = None
-        
-        return prices
-    
     def get_prices_filtered(self, price_filter: PriceFilter) -> List[PriceView]:
         """Retrieve prices with filter criteria and calculate changes"""
+        rows = self.iter_prices_filtered(price_filter)
+        try:
+            return list(rows)
+        except sqlite3.Error as e:
+            raise DatabaseError("Fehler beim Filtern der Kurse", f"SQL-Fehler: {str(e)}")
+    
+    def iter_prices_filtered(self, price_filter: PriceFilter) -> Iterator[PriceView]:
+        """Run the filtered query now; PriceViews are built while iterating the cursor"""
         if not self._connection:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
         try:
+            # LAG() runs after the WHERE clause, so each change refers to the
+            # previous price inside the filtered range, per asset
             query_parts = ["""
-                SELECT a.symbol, a.name, p.close, p.currency, COALESCE(p.source, ''), p.price_date
+                SELECT a.symbol, a.name, p.close, p.currency, COALESCE(p.source, '') AS source, p.price_date,
+                       LAG(CAST(p.close AS REAL)) OVER (
+                           PARTITION BY p.asset_id ORDER BY p.price_date
+                       ) AS prev_close
                 FROM price p
                 JOIN asset a ON a.id = p.asset_id
                 WHERE 1=1
@@ -437,11 +658,11 @@ class PriceRepository:
             
             if price_filter.date_from:
                 query_parts.append("AND p.price_date >= ?")
-                params.append(price_filter.date_from.isoformat())
+                params.append(_iso(price_filter.date_from))
             
             if price_filter.date_to:
                 query_parts.append("AND p.price_date <= ?")
-                params.append(price_filter.date_to.isoformat())
+                params.append(_iso(price_filter.date_to))
             
             if price_filter.asset_id:
                 query_parts.append("AND a.id = ?")
@@ -455,22 +676,18 @@ class PriceRepository:
                 query_parts.append("AND p.currency = ?")
                 params.append(price_filter.currency)
             
-            query_parts.append("ORDER BY a.symbol, p.price_date")
-            
-            query = "\n".join(query_parts)
-            rows = self._connection.execute(query, params).fetchall()
-            
-            prices = [
-                PriceView(
-                    symbol=row[0], name=row[1], close=float(row[2]),
-                    currency=row[3], source=row[4],
-                    price_date=date.fromisoformat(row[5])
-                )
-                for row in rows
-            ]
-            
-            # Calculate percentage changes
-            return self._calculate_price_changes(prices)
+            filtered_query = "\n".join(query_parts)
+            query = f"""
+                SELECT symbol, name, close, currency, source, price_date,
+                       CASE WHEN prev_close > 0
+                            THEN (close - prev_close) / prev_close * 100
+                       END
+                FROM ({filtered_query})
+                ORDER BY symbol, price_date
+            """
+            cursor = self._connection.cursor()
+            cursor.row_factory = _price_view_factory
+            return cursor.execute(query, params)
             
         except sqlite3.Error as e:
             raise DatabaseError("Fehler beim Filtern der Kurse", f"SQL-Fehler: {str(e)}")
@@ -481,8 +698,7 @@ class PriceRepository:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
         try:
-            query = "SELECT DISTINCT currency FROM price ORDER BY currency"
-            rows = self._connection.execute(query).fetchall()
+            rows = self._connection.execute(_DISTINCT_CURRENCIES_SQL).fetchall()
             return [row[0] for row in rows]
         except sqlite3.Error as e:
             raise DatabaseError("Fehler beim Laden der Währungen", f"SQL-Fehler: {str(e)}")
@@ -494,31 +710,19 @@ class PriceRepository:
         if not self._connection:
             raise DatabaseError("Keine aktive Datenbankverbindung")
 
-        if transaction.asset_id <= 0:
-            raise DatabaseError("Ungültiges Asset", f"Asset ID {transaction.asset_id} ist ungültig.")
-        if transaction.quantity <= 0:
-            raise DatabaseError("Ungültige Menge", "Menge muss größer als 0 sein.")
-        if transaction.price <= 0:
-            raise DatabaseError("Ungültiger Preis", "Preis muss größer als 0 sein.")
-        if not transaction.currency or len(transaction.currency.strip()) != 3:
-            raise DatabaseError("Ungültige Währung", "Währung muss genau 3 Buchstaben haben.")
+        self._validate_transaction(transaction)
         
         try:
             with self.transaction():
-                query = """
-                    INSERT INTO portfolio_transaction 
-                    (asset_id, transaction_type, quantity, price, currency, transaction_date, notes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """
                 cursor = self._connection.execute(
-                    query,
+                    _SAVE_TRANSACTION_SQL,
                     (
                         transaction.asset_id,
                         transaction.transaction_type.value,
                         transaction.quantity,
                         transaction.price,
                         transaction.currency,
-                        transaction.transaction_date.isoformat(),
+                        _iso(transaction.transaction_date),
                         transaction.notes
                     )
                 )
@@ -526,55 +730,56 @@ class PriceRepository:
         except Exception as e:
             raise DatabaseError("Fehler beim Speichern der Transaktion", str(e))
     
+    def save_transactions_bulk(self, transactions: Iterable[Transaction]) -> int:
+        """Save many portfolio transactions in a single transaction"""
+        if not self._connection:
+            raise DatabaseError("Keine aktive Datenbankverbindung")
+        
+        transactions = list(transactions)
+        for transaction in transactions:
+            self._validate_transaction(transaction)
+        
+        try:
+            with self.transaction():
+                for start in range(0, len(transactions), self.BULK_CHUNK_SIZE):
+                    self._connection.executemany(
+                        _SAVE_TRANSACTION_SQL,
+                        (
+                            (
+                                t.asset_id,
+                                t.transaction_type.value,
+                                t.quantity,
+                                t.price,
+                                t.currency,
+                                _iso(t.transaction_date),
+                                t.notes
+                            )
+                            for t in transactions[start:start + self.BULK_CHUNK_SIZE]
+                        )
+                    )
+            return len(transactions)
+        except Exception as e:
+            raise DatabaseError("Fehler beim Speichern der Transaktionen", str(e))
+    
+    @staticmethod
+    def _validate_transaction(transaction: Transaction) -> None:
+        """Reject transactions that must not reach the database"""
+        if transaction.asset_id <= 0:
+            raise DatabaseError("Ungültiges Asset", f"Asset ID {transaction.asset_id} ist ungültig.")
+        if transaction.quantity <= 0:
+            raise DatabaseError("Ungültige Menge", "Menge muss größer als 0 sein.")
+        if transaction.price <= 0:
+            raise DatabaseError("Ungültiger Preis", "Preis muss größer als 0 sein.")
+        if not _is_currency_code(transaction.currency):
+            raise DatabaseError("Ungültige Währung", "Währung muss genau 3 Buchstaben haben.")
+    
     def get_portfolio_positions(self) -> List[PortfolioPosition]:
         """Get all current portfolio positions"""
         if not self._connection:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
         try:
-            query = """
-                SELECT 
-                    a.id,
-                    a.symbol,
-                    a.name,
-                    SUM(CASE 
-                        WHEN pt.transaction_type = 'buy' THEN pt.quantity 
-                        WHEN pt.transaction_type = 'sell' THEN -pt.quantity 
-                    END) as total_quantity,
-                    SUM(CASE 
-                        WHEN pt.transaction_type = 'buy' THEN pt.quantity * pt.price 
-                        WHEN pt.transaction_type = 'sell' THEN -pt.quantity * pt.price 
-                    END) / NULLIF(SUM(CASE 
-                        WHEN pt.transaction_type = 'buy' THEN pt.quantity 
-                        WHEN pt.transaction_type = 'sell' THEN -pt.quantity 
-                    END), 0) as avg_price,
-                    pt.currency,
-                    MIN(pt.transaction_date) as first_buy_date,
-                    MAX(pt.transaction_date) as last_transaction_date
-                FROM portfolio_transaction pt
-                JOIN asset a ON a.id = pt.asset_id
-                GROUP BY a.id, a.symbol, a.name, pt.currency
-                HAVING total_quantity > 0
-                ORDER BY a.symbol
-            """
-            
-            rows = self._connection.execute(query).fetchall()
-            
-            positions = []
-            for row in rows:
-                positions.append(PortfolioPosition(
-                    id=row[0],
-                    asset_id=row[0],
-                    symbol=row[1],
-                    name=row[2],
-                    quantity=float(row[3]),
-                    average_buy_price=float(row[4]) if row[4] else 0.0,
-                    currency=row[5],
-                    first_buy_date=date.fromisoformat(row[6]),
-                    last_transaction_date=date.fromisoformat(row[7])
-                ))
-            
-            return positions
+            return self._fetch_models(_position_factory, _PORTFOLIO_POSITIONS_SQL)
             
         except sqlite3.Error as e:
             raise DatabaseError("Fehler beim Laden der Portfolio-Positionen", f"SQL-Fehler: {str(e)}")
@@ -588,20 +793,17 @@ class PriceRepository:
             positions = self.get_portfolio_positions()
             summaries = []
             
+            latest_prices: Dict[int, Tuple[float, date]] = {
+                asset_id: (float(close), _iso_date(price_date))
+                for asset_id, close, price_date
+                in self._connection.execute(_LATEST_PRICES_SQL)
+            }
+            
             for pos in positions:
-                # Get latest price for this asset
-                price_query = """
-                    SELECT close, price_date
-                    FROM price
-                    WHERE asset_id = ?
-                    ORDER BY price_date DESC
-                    LIMIT 1
-                """
-                price_row = self._connection.execute(price_query, (pos.asset_id,)).fetchone()
+                price_entry = latest_prices.get(pos.asset_id)
                 
-                if price_row:
-                    current_price = float(price_row[0])
-                    last_update = date.fromisoformat(price_row[1])
+                if price_entry:
+                    current_price, last_update = price_entry
                 else:
                     current_price = 0.0
                     last_update = date.today()
@@ -638,30 +840,9 @@ class PriceRepository:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
         try:
-            query = """
-                SELECT id, asset_id, transaction_type, quantity, price, 
-                       currency, transaction_date, notes
-                FROM portfolio_transaction
-                WHERE asset_id = ?
-                ORDER BY transaction_date DESC
-            """
-            
-            rows = self._connection.execute(query, (asset_id,)).fetchall()
-            
-            transactions = []
-            for row in rows:
-                transactions.append(Transaction(
-                    id=row[0],
-                    asset_id=row[1],
-                    transaction_type=TransactionType(row[2]),
-                    quantity=float(row[3]),
-                    price=float(row[4]),
-                    currency=row[5],
-                    transaction_date=date.fromisoformat(row[6]),
-                    notes=row[7]
-                ))
-            
-            return transactions
+            return self._fetch_models(
+                _transaction_factory, _TRANSACTIONS_FOR_ASSET_SQL, (asset_id,)
+            )
             
         except sqlite3.Error as e:
             raise DatabaseError("Fehler beim Laden der Transaktionen", f"SQL-Fehler: {str(e)}")
@@ -672,29 +853,7 @@ class PriceRepository:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
         try:
-            query = """
-                SELECT id, asset_id, transaction_type, quantity, price, 
-                       currency, transaction_date, notes
-                FROM portfolio_transaction
-                ORDER BY transaction_date DESC
-            """
-            
-            rows = self._connection.execute(query).fetchall()
-            
-            transactions = []
-            for row in rows:
-                transactions.append(Transaction(
-                    id=row[0],
-                    asset_id=row[1],
-                    transaction_type=TransactionType(row[2]),
-                    quantity=float(row[3]),
-                    price=float(row[4]),
-                    currency=row[5],
-                    transaction_date=date.fromisoformat(row[6]),
-                    notes=row[7]
-                ))
-            
-            return transactions
+            return self._fetch_models(_transaction_factory, _ALL_TRANSACTIONS_SQL)
             
         except sqlite3.Error as e:
             raise DatabaseError("Fehler beim Laden aller Transaktionen", f"SQL-Fehler: {str(e)}")
@@ -731,12 +890,61 @@ class PriceRepository:
         except Exception as e:
             raise DatabaseError("Fehler beim Leeren des Portfolios", str(e))
     
+    def get_prices_bulk(
+        self,
+        asset_ids: Sequence[int],
+        start_date: date,
+        end_date: date
+    ) -> Dict[int, List[Tuple[date, float]]]:
+        """Closes per asset in a date range, ascending, led by the last close before it"""
+        if not self._connection:
+            raise DatabaseError("Keine aktive Datenbankverbindung")
+        
+        prices_by_asset: Dict[int, List[Tuple[date, float]]] = {
+            asset_id: [] for asset_id in asset_ids
+        }
+        if not prices_by_asset:
+            return prices_by_asset
+        
+        # The seed row lets as-of lookups answer dates before the first
+        # price inside the range
+        placeholders = ", ".join("?" * len(prices_by_asset))
+        query = f"""
+            SELECT asset_id, price_date, close
+            FROM (
+                SELECT asset_id, close, price_date,
+                       ROW_NUMBER() OVER (PARTITION BY asset_id ORDER BY price_date DESC) AS rn
+                FROM price
+                WHERE asset_id IN ({placeholders}) AND price_date < ?
+            )
+            WHERE rn = 1
+            UNION ALL
+            SELECT asset_id, price_date, close
+            FROM price
+            WHERE asset_id IN ({placeholders}) AND price_date BETWEEN ? AND ?
+            ORDER BY asset_id, price_date
+        """
+        
+        ids = tuple(prices_by_asset)
+        start_iso = _iso(start_date)
+        try:
+            for asset_id, price_date, close in self._connection.execute(
+                query, (*ids, start_iso, *ids, start_iso, _iso(end_date))
+            ):
+                prices_by_asset[asset_id].append((_iso_date(price_date), float(close)))
+        except sqlite3.Error as e:
+            raise DatabaseError("Fehler beim Laden der Kurse", f"SQL-Fehler: {str(e)}")
+        
+        return prices_by_asset
+    
     def get_portfolio_value_history(
         self, 
         start_date: date, 
         end_date: date
     ) -> List[Tuple[date, float]]:
         """Get portfolio value history over time"""
+        import numpy as np
+        
         if not self._connection:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
@@ -745,44 +953,31 @@ class PriceRepository:
             if not positions:
                 return []
             
-            date_query = """
-                SELECT DISTINCT price_date
-                FROM price
-                WHERE price_date BETWEEN ? AND ?
-                ORDER BY price_date
-            """
-            
             date_rows = self._connection.execute(
-                date_query,
-                (start_date.isoformat(), end_date.isoformat())
+                _PRICE_DATES_IN_RANGE_SQL,
+                (_iso(start_date), _iso(end_date))
             ).fetchall()
             
-            value_history = []
+            if not date_rows:
+                return []
             
-            for date_row in date_rows:
-                current_date = date.fromisoformat(date_row[0])
-                total_value = 0.0
-                
-                for pos in positions:
-                    price_query = """
-                        SELECT close
-                        FROM price
-                        WHERE asset_id = ? AND price_date <= ?
-                        ORDER BY price_date DESC
-                        LIMIT 1
-                    """
-                    price_row = self._connection.execute(
-                        price_query,
-                        (pos.asset_id, current_date.isoformat())
-                    ).fetchone()
-                    
-                    if price_row:
-                        price = float(price_row[0])
-                        total_value += pos.quantity * price
-                
-                value_history.append((current_date, total_value))
+            prices_by_asset = self.get_prices_bulk(
+                [pos.asset_id for pos in positions], start_date, end_date
+            )
+            dates = [_iso_date(row[0]) for row in date_rows]
+            date_keys = np.array(dates, dtype="datetime64[D]")
+            quantities = np.array([pos.quantity for pos in positions], dtype=np.float64)
+            
+            # (dates x positions) matrix of the most recent close on or before
+            # each date; index 0 of each padded column stands for "no price yet"
+            price_matrix = np.empty((len(dates), len(positions)), dtype=np.float64)
+            for column, pos in enumerate(positions):
+                series = prices_by_asset[pos.asset_id]
+                series_dates = np.array([day for day, _ in series], dtype="datetime64[D]")
+                closes = np.array([0.0] + [close for _, close in series], dtype=np.float64)
+                price_matrix[:, column] = closes[np.searchsorted(series_dates, date_keys, side="right")]
             
-            return value_history
+            return list(zip(dates, (price_matrix @ quantities).tolist()))
             
         except sqlite3.Error as e:
             raise DatabaseError("Fehler beim Laden der Portfolio-Wertentwicklung", f"SQL-Fehler: {str(e)}")
@@ -792,22 +987,28 @@ class PriceRepository:
         if not self._connection:
             raise DatabaseError("Keine aktive Datenbankverbindung")
         
+        asset = self._asset_cache_by_symbol.get(symbol)
+        if asset is not None:
+            return asset
+        
         try:
-            query = """
-                SELECT id, symbol, name, active
-                FROM asset
-                WHERE symbol = ?
-            """
-            row = self._connection.execute(query, (symbol,)).fetchone()
-            
-            if row:
-                return Asset(
-                    id=row[0],
-                    symbol=row[1],
-                    name=row[2],
-                    active=bool(row[3])
-                )
-            return None
-            
+            row = self._connection.execute(_ASSET_BY_SYMBOL_SQL, (symbol,)).fetchone()
         except sqlite3.Error as e:
-            raise DatabaseError("Fehler beim Laden des Assets", f"SQL-Fehler: {str(e)}")
\ No newline at end of file
+            raise DatabaseError("Fehler beim Laden des Assets", f"SQL-Fehler: {str(e)}")
+        
+        if not row:
+            # Misses are not cached: the symbol may be added later
+            return None
+        
+        asset = Asset(
+            id=row[0],
+            symbol=row[1],
+            name=row[2],
+            active=bool(row[3])
+        )
+        self._asset_cache_by_symbol[symbol] = asset
+        return asset
+    
+    def invalidate_asset_cache(self) -> None:
+        """Forget cached asset lookups after the asset table changed"""
+        self._asset_cache_by_symbol.clear()
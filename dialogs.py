@@ -5,6 +5,12 @@ from tkinter import ttk
 class CountdownDialog(tk.Toplevel):
     """Dialog mit Countdown-Timer für kritische Aktionen"""
 
+    _ICON_MAP = {
+        "warning": "⚠️",
+        "error": "❌",
+        "question": "❓",
+    }
+
     def __init__(
         self,
         parent: tk.Tk,
@@ -34,19 +40,17 @@ class CountdownDialog(tk.Toplevel):
         container = ttk.Frame(self, padding=16)
         container.pack(fill="both", expand=True)
 
-        icon_map = {
-            "warning": "⚠️",
-            "error": "❌",
-            "question": "❓",
-        }
-        icon_symbol = icon_map.get(self.icon, "⚠️")
+        icon_symbol = self._ICON_MAP.get(self.icon, "⚠️")
 
         ttk.Label(container, text=icon_symbol, font=("Segoe UI", 20)).pack(pady=(0, 8))
         ttk.Label(container, text=message, justify="left", wraplength=420).pack(anchor="w", pady=(0, 12))
 
+        self._countdown_var = tk.StringVar(
+            self, value=f"Fortfahren möglich in {self.remaining_seconds} Sekunden..."
+        )
         self.countdown_label = ttk.Label(
             container,
-            text=f"Fortfahren möglich in {self.remaining_seconds} Sekunden...",
+            textvariable=self._countdown_var,
             foreground="#B71C1C"
         )
         self.countdown_label.pack(anchor="w", pady=(0, 14))
@@ -75,13 +79,12 @@ class CountdownDialog(tk.Toplevel):
 
     def _tick(self) -> None:
         if self.remaining_seconds <= 0:
-            self.countdown_label.config(text="Sie können jetzt fortfahren.", foreground="#2E7D32")
+            self._countdown_var.set("Sie können jetzt fortfahren.")
+            self.countdown_label.config(foreground="#2E7D32")
             self.btn_continue.config(state="normal")
             return
 
-        self.countdown_label.config(
-            text=f"Fortfahren möglich in {self.remaining_seconds} Sekunden..."
-        )
+        self._countdown_var.set(f"Fortfahren möglich in {self.remaining_seconds} Sekunden...")
         self.remaining_seconds -= 1
         self.after(1000, self._tick)
 
@@ -105,6 +108,8 @@ class CountdownDialog(tk.Toplevel):
 class ConfirmationDialog(tk.Toplevel):
     """Dialog mit Text-Eingabe zur Bestätigung"""
 
+    _ICON = "🔒"
+
     def __init__(
         self,
         parent: tk.Tk,
@@ -131,7 +136,7 @@ class ConfirmationDialog(tk.Toplevel):
         container = ttk.Frame(self, padding=16)
         container.pack(fill="both", expand=True)
 
-        ttk.Label(container, text="🔒", font=("Segoe UI", 20)).pack(pady=(0, 8))
+        ttk.Label(container, text=self._ICON, font=("Segoe UI", 20)).pack(pady=(0, 8))
         ttk.Label(container, text=message, justify="left", wraplength=420).pack(anchor="w", pady=(0, 10))
 
         self.var_confirm = tk.StringVar()
@@ -1,14 +1,191 @@
 """Service for managing dividends"""
 
-from datetime import date, datetime
+import re
+import sqlite3
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 
 from database import PriceRepository
 from models import Dividend, DividendSummary, DividendCalendar, DividendType
 from exceptions import ValidationError, DatabaseError
 from validators import InputValidator
+from converters import to_decimal, parse_timestamp
+
+
+# Plain decimal numbers need no separator normalization before Decimal()
+_CANONICAL_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+_DIVIDEND_COLUMNS = (
+    "id, asset_id, payment_date, amount, currency, "
+    "tax_withheld, dividend_type, notes, created_at"
+)
+
+# Fixed statement texts, one per year branch, so every call hits the
+# connection's statement cache
+_DIVIDENDS_FOR_ASSET_SQL = f"""
+    SELECT {_DIVIDEND_COLUMNS}
+    FROM dividend
+    WHERE asset_id = ?
+    ORDER BY payment_date DESC
+"""
+
+_DIVIDENDS_FOR_ASSET_IN_YEAR_SQL = f"""
+    SELECT {_DIVIDEND_COLUMNS}
+    FROM dividend
+    WHERE asset_id = ? AND payment_date >= ? AND payment_date < ?
+    ORDER BY payment_date DESC
+"""
+
+_DIVIDEND_SUMMARY_TEMPLATE = """
+    SELECT
+        symbol,
+        name,
+        net_dividends,
+        dividend_count,
+        avg_dividend,
+        currency,
+        current_holdings,
+        asset_id,
+        CASE
+            WHEN current_price IS NOT NULL AND current_price * current_holdings > 0
+            THEN net_dividends * 100.0 / (current_price * current_holdings)
+        END as annual_yield_pct
+    FROM (
+        SELECT
+            a.symbol,
+            a.name,
+            SUM(d.amount - COALESCE(d.tax_withheld, 0)) as net_dividends,
+            COUNT(d.id) as dividend_count,
+            AVG(d.amount) as avg_dividend,
+            d.currency,
+            COALESCE(
+                (SELECT SUM(CASE WHEN transaction_type = 'buy' THEN quantity ELSE -quantity END)
+                 FROM portfolio_transaction
+                 WHERE asset_id = a.id), 0
+            ) as current_holdings,
+            a.id as asset_id,
+            (SELECT close FROM price
+             WHERE asset_id = a.id
+             ORDER BY price_date DESC LIMIT 1) as current_price
+        FROM dividend d
+        JOIN asset a ON a.id = d.asset_id
+        WHERE 1=1 {year_filter}
+        GROUP BY a.id, a.symbol, a.name, d.currency
+    )
+    ORDER BY net_dividends DESC
+"""
+_DIVIDEND_SUMMARY_SQL = _DIVIDEND_SUMMARY_TEMPLATE.format(year_filter="")
+_DIVIDEND_SUMMARY_IN_YEAR_SQL = _DIVIDEND_SUMMARY_TEMPLATE.format(
+    year_filter="AND d.payment_date >= ? AND d.payment_date < ?"
+)
+
+_TOTAL_DIVIDENDS_TEMPLATE = """
+    SELECT COALESCE(SUM(amount - COALESCE(tax_withheld, 0)), 0)
+    FROM dividend
+    WHERE currency = ? {year_filter}
+"""
+_TOTAL_DIVIDENDS_SQL = _TOTAL_DIVIDENDS_TEMPLATE.format(year_filter="")
+_TOTAL_DIVIDENDS_IN_YEAR_SQL = _TOTAL_DIVIDENDS_TEMPLATE.format(
+    year_filter="AND payment_date >= ? AND payment_date < ?"
+)
+
+_DIVIDEND_EXPORT_TEMPLATE = """
+    SELECT
+        a.symbol,
+        a.name,
+        d.payment_date,
+        d.amount,
+        COALESCE(d.tax_withheld, 0),
+        d.amount - COALESCE(d.tax_withheld, 0) as net_amount,
+        d.currency,
+        d.dividend_type,
+        COALESCE(d.notes, '')
+    FROM dividend d
+    JOIN asset a ON a.id = d.asset_id
+    {year_filter}
+    ORDER BY d.payment_date DESC
+"""
+_DIVIDEND_EXPORT_SQL = _DIVIDEND_EXPORT_TEMPLATE.format(year_filter="")
+_DIVIDEND_EXPORT_IN_YEAR_SQL = _DIVIDEND_EXPORT_TEMPLATE.format(
+    year_filter="WHERE d.payment_date >= ? AND d.payment_date < ?"
+)
+
+# Projects each asset's next payment from its latest one plus the average
+# gap between past payments; assets with a single payment have no cadence
+_DIVIDEND_CALENDAR_SQL = """
+    WITH history AS (
+        SELECT
+            asset_id,
+            payment_date,
+            amount,
+            currency,
+            dividend_type,
+            julianday(payment_date)
+                - julianday(LAG(payment_date) OVER (PARTITION BY asset_id ORDER BY payment_date)) as gap,
+            ROW_NUMBER() OVER (PARTITION BY asset_id ORDER BY payment_date DESC) as recency
+        FROM dividend
+    ),
+    cadence AS (
+        SELECT asset_id, CAST(ROUND(AVG(gap)) AS INTEGER) as avg_gap
+        FROM history
+        WHERE gap IS NOT NULL
+        GROUP BY asset_id
+    ),
+    projection AS (
+        SELECT
+            h.asset_id,
+            date(h.payment_date, '+' || c.avg_gap || ' days') as projected_date,
+            h.amount,
+            h.currency,
+            h.dividend_type
+        FROM history h
+        JOIN cadence c ON c.asset_id = h.asset_id
+        WHERE h.recency = 1
+    )
+    SELECT a.symbol, a.name, p.projected_date, p.amount, p.currency, p.dividend_type
+    FROM projection p
+    JOIN asset a ON a.id = p.asset_id
+    WHERE p.projected_date >= ? AND p.projected_date <= ?
+    ORDER BY p.projected_date, a.symbol
+"""
+
+_DELETE_DIVIDEND_SQL = "DELETE FROM dividend WHERE id = ?"
+
+_UPSERT_DIVIDEND_SQL = """
+    INSERT INTO dividend
+    (asset_id, payment_date, amount, currency, tax_withheld, dividend_type, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(asset_id, payment_date) DO UPDATE SET
+        amount = excluded.amount,
+        currency = excluded.currency,
+        tax_withheld = excluded.tax_withheld,
+        dividend_type = excluded.dividend_type,
+        notes = excluded.notes
+"""
+
+
+def _year_bounds(year: int) -> Tuple[str, str]:
+    """Half-open ISO range for a calendar year; keeps payment_date indexable"""
+    return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+
+
+def _dividend_factory(cursor: sqlite3.Cursor, row: tuple) -> Dividend:
+    """Row factory building a Dividend straight from the cursor."""
+    (dividend_id, asset_id, payment_date, amount, currency,
+     tax_withheld, dividend_type, notes, created_at) = row
+    return Dividend(
+        id=dividend_id,
+        asset_id=asset_id,
+        payment_date=date.fromisoformat(payment_date),
+        amount=to_decimal(amount),
+        currency=currency,
+        tax_withheld=to_decimal(tax_withheld or 0),
+        dividend_type=DividendType(dividend_type),
+        notes=notes,
+        created_at=parse_timestamp(created_at),
+    )
 
 
 class DividendService:
@@ -29,49 +206,13 @@ class DividendService:
     ) -> int:
         """Add a dividend payment."""
         try:
-            validated_date = InputValidator.validate_date(payment_date)
-            validated_amount = InputValidator.validate_price(amount_str)
-            validated_tax = self._parse_non_negative_amount(tax_withheld_str)
-            validated_currency = InputValidator.validate_currency(currency)
-
-            if asset_id <= 0:
-                raise ValidationError("Ungültiges Asset", f"Asset ID {asset_id} ist ungültig.")
-
-            if validated_amount <= 0:
-                raise ValidationError(
-                    "Ungültiger Dividendenbetrag",
-                    "Dividende muss größer als 0 sein."
-                )
-
-            if validated_tax > validated_amount:
-                raise ValidationError(
-                    "Steuer zu hoch",
-                    f"Quellensteuer ({validated_tax}) kann nicht höher als Dividende ({validated_amount}) sein."
-                )
+            params = self._validated_dividend_params(
+                asset_id, payment_date, amount_str, currency,
+                tax_withheld_str, dividend_type, notes
+            )
 
             with self._db.transaction():
-                cursor = self._db.execute(
-                    """
-                    INSERT INTO dividend
-                    (asset_id, payment_date, amount, currency, tax_withheld, dividend_type, notes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(asset_id, payment_date) DO UPDATE SET
-                        amount = excluded.amount,
-                        currency = excluded.currency,
-                        tax_withheld = excluded.tax_withheld,
-                        dividend_type = excluded.dividend_type,
-                        notes = excluded.notes
-                    """,
-                    (
-                        asset_id,
-                        validated_date.isoformat(),
-                        float(validated_amount),
-                        validated_currency,
-                        float(validated_tax),
-                        dividend_type.value,
-                        notes,
-                    ),
-                )
+                cursor = self._db.execute(_UPSERT_DIVIDEND_SQL, params)
                 return cursor.lastrowid
 
         except ValidationError:
@@ -79,90 +220,91 @@ class DividendService:
         except Exception as e:
             raise DatabaseError("Fehler beim Speichern der Dividende", str(e))
 
+    def add_dividends_bulk(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Add many dividend payments in one transaction.
+
+        Each record holds the keyword arguments of add_dividend(). All records
+        are validated first, so an invalid one leaves the database untouched.
+        """
+        params = [self._validated_dividend_params(**record) for record in records]
+        if not params:
+            return 0
+
+        try:
+            with self._db.transaction():
+                self._db.executemany(_UPSERT_DIVIDEND_SQL, params)
+            return len(params)
+        except Exception as e:
+            raise DatabaseError("Fehler beim Speichern der Dividenden", str(e))
+
+    def _validated_dividend_params(
+        self,
+        asset_id: int,
+        payment_date: date,
+        amount_str: str,
+        currency: str,
+        tax_withheld_str: str = "0",
+        dividend_type: DividendType = DividendType.REGULAR,
+        notes: Optional[str] = None
+    ) -> Tuple:
+        """Validate one dividend and return its INSERT parameters."""
+        validated_date = InputValidator.validate_date(payment_date)
+        validated_amount = InputValidator.validate_price(amount_str)
+        validated_tax = self._parse_non_negative_amount(tax_withheld_str)
+        validated_currency = InputValidator.validate_currency(currency)
+
+        if asset_id <= 0:
+            raise ValidationError("Ungültiges Asset", f"Asset ID {asset_id} ist ungültig.")
+
+        if validated_amount <= 0:
+            raise ValidationError(
+                "Ungültiger Dividendenbetrag",
+                "Dividende muss größer als 0 sein."
+            )
+
+        if validated_tax > validated_amount:
+            raise ValidationError(
+                "Steuer zu hoch",
+                f"Quellensteuer ({validated_tax}) kann nicht höher als Dividende ({validated_amount}) sein."
+            )
+
+        return (
+            asset_id,
+            validated_date.isoformat(),
+            float(validated_amount),
+            validated_currency,
+            float(validated_tax),
+            dividend_type.value,
+            notes,
+        )
+
     def get_dividends_for_asset(self, asset_id: int, year: Optional[int] = None) -> List[Dividend]:
         """Get all dividends for an asset."""
         try:
             if year:
-                rows = self._db.execute(
-                    """
-                    SELECT id, asset_id, payment_date, amount, currency,
-                           tax_withheld, dividend_type, notes, created_at
-                    FROM dividend
-                    WHERE asset_id = ? AND strftime('%Y', payment_date) = ?
-                    ORDER BY payment_date DESC
-                    """,
-                    (asset_id, str(year)),
-                ).fetchall()
+                query = _DIVIDENDS_FOR_ASSET_IN_YEAR_SQL
+                params = (asset_id, *_year_bounds(year))
             else:
-                rows = self._db.execute(
-                    """
-                    SELECT id, asset_id, payment_date, amount, currency,
-                           tax_withheld, dividend_type, notes, created_at
-                    FROM dividend
-                    WHERE asset_id = ?
-                    ORDER BY payment_date DESC
-                    """,
-                    (asset_id,),
-                ).fetchall()
-
-            return [self._row_to_dividend(row) for row in rows]
+                query = _DIVIDENDS_FOR_ASSET_SQL
+                params = (asset_id,)
+
+            with self._db.cursor() as cursor:
+                cursor.row_factory = _dividend_factory
+                return cursor.execute(query, params).fetchall()
         except Exception as e:
             raise DatabaseError("Fehler beim Laden der Dividenden", str(e))
 
     def get_dividend_summary(self, year: Optional[int] = None) -> List[DividendSummary]:
         """Get dividend summary for all assets."""
         try:
-            year_filter = ""
-            params: List[str] = []
-
             if year:
-                year_filter = "AND strftime('%Y', d.payment_date) = ?"
-                params.append(str(year))
-
-            rows = self._db.execute(
-                f"""
-                SELECT
-                    a.symbol,
-                    a.name,
-                    SUM(d.amount - COALESCE(d.tax_withheld, 0)) as net_dividends,
-                    COUNT(d.id) as dividend_count,
-                    AVG(d.amount) as avg_dividend,
-                    d.currency,
-                    COALESCE(
-                        (SELECT SUM(CASE WHEN transaction_type = 'buy' THEN quantity ELSE -quantity END)
-                         FROM portfolio_transaction
-                         WHERE asset_id = a.id), 0
-                    ) as current_holdings,
-                    a.id as asset_id
-                FROM dividend d
-                JOIN asset a ON a.id = d.asset_id
-                WHERE 1=1 {year_filter}
-                GROUP BY a.id, a.symbol, a.name, d.currency
-                ORDER BY net_dividends DESC
-                """,
-                tuple(params),
-            ).fetchall()
+                rows = self._db.execute(_DIVIDEND_SUMMARY_IN_YEAR_SQL, _year_bounds(year)).fetchall()
+            else:
+                rows = self._db.execute(_DIVIDEND_SUMMARY_SQL).fetchall()
 
             summaries: List[DividendSummary] = []
             for row in rows:
-                annual_yield = None
-                try:
-                    price_row = self._db.execute(
-                        """
-                        SELECT close FROM price
-                        WHERE asset_id = ?
-                        ORDER BY price_date DESC LIMIT 1
-                        """,
-                        (row[7],),
-                    ).fetchone()
-
-                    if price_row and row[6] > 0:
-                        current_price = Decimal(str(price_row[0]))
-                        total_value = current_price * Decimal(str(row[6]))
-                        if total_value > 0:
-                            annual_yield = (Decimal(str(row[2])) / total_value) * Decimal("100")
-                except Exception:
-                    annual_yield = None
+                annual_yield = Decimal(str(row[8])) if row[8] is not None else None
 
                 summaries.append(
                     DividendSummary(
@@ -185,21 +327,12 @@ class DividendService:
         """Get total dividends received."""
         try:
             validated_currency = InputValidator.validate_currency(currency)
-            year_filter = ""
-            params: List[str] = [validated_currency]
-
             if year:
-                year_filter = "AND strftime('%Y', payment_date) = ?"
-                params.append(str(year))
-
-            result = self._db.execute(
-                f"""
-                SELECT COALESCE(SUM(amount - COALESCE(tax_withheld, 0)), 0)
-                FROM dividend
-                WHERE currency = ? {year_filter}
-                """,
-                tuple(params),
-            ).fetchone()
+                result = self._db.execute(
+                    _TOTAL_DIVIDENDS_IN_YEAR_SQL, (validated_currency, *_year_bounds(year))
+                ).fetchone()
+            else:
+                result = self._db.execute(_TOTAL_DIVIDENDS_SQL, (validated_currency,)).fetchone()
 
             return Decimal(str(result[0] if result else 0))
         except ValidationError:
@@ -209,13 +342,30 @@ class DividendService:
 
     def get_dividend_calendar(self, days_ahead: int = 90) -> List[DividendCalendar]:
         """Get upcoming dividends (projection based on past payments)."""
-        return []
+        today = date.today()
+        window = (today.isoformat(), (today + timedelta(days=max(0, days_ahead))).isoformat())
+
+        try:
+            rows = self._db.execute(_DIVIDEND_CALENDAR_SQL, window).fetchall()
+            return [
+                DividendCalendar(
+                    symbol=symbol,
+                    name=name,
+                    payment_date=date.fromisoformat(projected_date),
+                    amount=to_decimal(amount),
+                    currency=currency,
+                    dividend_type=DividendType(dividend_type),
+                )
+                for symbol, name, projected_date, amount, currency, dividend_type in rows
+            ]
+        except Exception as e:
+            raise DatabaseError("Fehler beim Berechnen des Dividenden-Kalenders", str(e))
 
     def delete_dividend(self, dividend_id: int) -> None:
         """Delete a dividend payment."""
         try:
             with self._db.transaction():
-                self._db.execute("DELETE FROM dividend WHERE id = ?", (dividend_id,))
+                self._db.execute(_DELETE_DIVIDEND_SQL, (dividend_id,))
         except Exception as e:
             raise DatabaseError("Fehler beim Löschen der Dividende", str(e))
 
@@ -224,61 +374,31 @@ class DividendService:
         import csv
 
         try:
-            year_filter = ""
-            params: List[str] = []
             if year:
-                year_filter = "WHERE strftime('%Y', d.payment_date) = ?"
-                params.append(str(year))
-
-            rows = self._db.execute(
-                f"""
-                SELECT
-                    a.symbol,
-                    a.name,
-                    d.payment_date,
-                    d.amount,
-                    COALESCE(d.tax_withheld, 0),
-                    d.amount - COALESCE(d.tax_withheld, 0) as net_amount,
-                    d.currency,
-                    d.dividend_type,
-                    COALESCE(d.notes, '')
-                FROM dividend d
-                JOIN asset a ON a.id = d.asset_id
-                {year_filter}
-                ORDER BY d.payment_date DESC
-                """,
-                tuple(params),
-            ).fetchall()
+                cursor = self._db.execute(_DIVIDEND_EXPORT_IN_YEAR_SQL, _year_bounds(year))
+            else:
+                cursor = self._db.execute(_DIVIDEND_EXPORT_SQL)
 
             with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
                 writer = csv.writer(f, delimiter=";")
                 writer.writerow([
                     "Symbol", "Name", "Datum", "Brutto", "Steuer", "Netto", "Währung", "Typ", "Notizen"
                 ])
-                writer.writerows(rows)
+                # Rows go from the cursor to the file without a full result list
+                writer.writerows(cursor)
         except Exception as e:
             raise DatabaseError("Fehler beim CSV-Export", str(e))
 
-    def _row_to_dividend(self, row) -> Dividend:
-        return Dividend(
-            id=row[0],
-            asset_id=row[1],
-            payment_date=date.fromisoformat(row[2]),
-            amount=Decimal(str(row[3])),
-            currency=row[4],
-            tax_withheld=Decimal(str(row[5] or 0)),
-            dividend_type=DividendType(row[6]),
-            notes=row[7],
-            created_at=datetime.fromisoformat(row[8]) if row[8] else None,
-        )
-
     @staticmethod
     def _parse_non_negative_amount(value: str) -> Decimal:
         clean = (value or "").strip()
         if clean == "":
             return Decimal("0")
 
-        normalized = clean.replace(",", ".").replace(" ", "")
+        if _CANONICAL_NUMBER.fullmatch(clean):
+            normalized = clean
+        else:
+            normalized = clean.replace(",", ".").replace(" ", "")
         try:
             parsed = Decimal(normalized)
         except Exception as exc:
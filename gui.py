@@ -1,10 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Set
 from pathlib import Path
 from decimal import Decimal, InvalidOperation
+import re
+import shutil
 import sqlite3
+import weakref
 from tkcalendar import DateEntry
 
 from models import (
@@ -29,9 +32,68 @@ from config import AppConfig, Constants
 from icon_manager import IconManager, EmojiIcons
 
 
+# German number formatting -> float(): drop thousands dots, decimal comma to dot,
+# strip currency/percent/sign markers in a single pass
+_SORT_TRANS = str.maketrans({'.': '', ',': '.', '€': '', '%': '', '+': ''})
+
+# Characters a quantity entry accepts while typing
+_QUANTITY_INPUT = re.compile(r"[0-9,.+ ]*")
+
+# Inserts a list of option lists into a treeview and returns the new item ids,
+# so a whole table is filled with one Python -> Tcl call
+_INSERT_ROWS_PROC = """
+proc ::portfolio_insert_rows {tree rows} {
+    set items {}
+    foreach options $rows {
+        lappend items [$tree insert {} end {*}$options]
+    }
+    return $items
+}
+"""
+
+
 class PriceGui(tk.Tk):
     """Main GUI for portfolio price management"""
     
+    # Base heading text of each sortable table, without sort arrows
+    _COLUMN_NAMES = {
+        "prices": {
+            "symbol": "Symbol",
+            "name": "Name",
+            "close": "Kurs",
+            "currency": "Währung",
+            "change": "Änderung %",
+            "date": "Datum",
+        },
+        "portfolio": {
+            "symbol": "Symbol",
+            "name": "Name",
+            "quantity": "Menge",
+            "avg_price": "Ø Kaufpreis",
+            "current_price": "Aktueller Kurs",
+            "value": "Wert",
+            "profit_loss": "Gewinn/Verlust",
+            "profit_percent": "G/V %",
+        },
+        "dividends": {
+            "symbol": "Symbol",
+            "name": "Name",
+            "total_dividends": "Gesamt Netto",
+            "dividend_count": "Anzahl",
+            "average_dividend": "Ø Dividende",
+            "current_holdings": "Bestand",
+            "annual_yield": "Rendite %",
+            "currency": "Währung",
+        },
+        "alerts": {
+            "symbol": "Symbol",
+            "name": "Name",
+            "type": "Typ",
+            "threshold": "Schwellwert",
+            "status": "Status",
+        },
+    }
+    
     def __init__(self, config: AppConfig, price_service: PriceService, portfolio_service: PortfolioService):
         super().__init__()
         
@@ -48,6 +110,8 @@ class PriceGui(tk.Tk):
         self._backup_service: Optional[BackupService] = None
         self._dividend_service: Optional[DividendService] = None
         self._alert_service: Optional[AlertService] = None
+        # Tabs whose tables are stale; each refreshes when it becomes visible
+        self._dirty_tabs: Set[int] = set()
         self._is_fullscreen = config.fullscreen
         if config.default_theme == "dark":
             default_mode = ThemeMode.DARK
@@ -57,6 +121,10 @@ class PriceGui(tk.Tk):
             default_mode = ThemeMode.LIGHT
         self._theme_manager = ThemeManager(config.theme_config_file, default_mode=default_mode)
         self._theme_manager.register_theme_change_callback(self._on_theme_changed)
+        # Palettes the ttk styles and the widgets were last built for
+        self._styled_palette: Optional[ColorPalette] = None
+        self._applied_palette: Optional[ColorPalette] = None
+        self._theme_apply_pending = False
         
         self._setup_window()
         self._setup_styles()
@@ -64,8 +132,7 @@ class PriceGui(tk.Tk):
         self._build_ui()
         self._build_menu()
         self._setup_keybindings()
-        self._refresh_prices()
-        self._refresh_portfolio()
+        self._mark_tabs_dirty()
         self._apply_theme()
 
     def set_backup_service(self, backup_service: BackupService):
@@ -75,13 +142,13 @@ class PriceGui(tk.Tk):
     def set_dividend_service(self, dividend_service: DividendService):
         """Set dividend service for dividends tab operations"""
         self._dividend_service = dividend_service
-        self._refresh_dividends()
+        self._mark_tabs_dirty(2)
 
     def set_alert_service(self, alert_service: AlertService):
         """Set alert service for alert tab operations"""
         self._alert_service = alert_service
         self._alert_service.set_notification_callback(self._show_desktop_notification)
-        self._refresh_alerts()
+        self._mark_tabs_dirty(3)
 
     def _backup_before_critical_action(self, action_name: str) -> bool:
         if not self._config.enable_auto_backup:
@@ -133,7 +200,7 @@ class PriceGui(tk.Tk):
             if new_value == "":
                 return True
 
-            if not all(c.isdigit() or c in ',.+ ' for c in new_value):
+            if not _QUANTITY_INPUT.fullmatch(new_value):
                 return False
 
             try:
@@ -150,24 +217,41 @@ class PriceGui(tk.Tk):
     
     # ==================== SORTABLE COLUMNS ====================
     
-    def _make_sortable(self, tree, columns):
+    def _make_sortable(self, tree, columns, kind):
         """
         Setup sortable columns for a treeview
         
         Args:
             tree: The treeview widget
             columns: List of column identifiers
+            kind: Key into _COLUMN_NAMES for the heading texts
         """
         # Store sort direction for each column
         if not hasattr(self, '_sort_state'):
-            self._sort_state = {}
-        
-        tree_id = str(id(tree))  # Unique ID for this tree
-        self._sort_state[tree_id] = {col: False for col in columns}  # False = ascending
+            # Per-tree sort state, keyed by the widget itself
+            self._sort_state = weakref.WeakKeyDictionary()
+            self._sort_columns = weakref.WeakKeyDictionary()
+            self._sort_headings = weakref.WeakKeyDictionary()
+            self._row_keys = weakref.WeakKeyDictionary()
+            self.tk.eval(_INSERT_ROWS_PROC)
+        
+        self._sort_state[tree] = {col: False for col in columns}  # False = ascending
+        self._sort_columns[tree] = tuple(columns)
+        self._sort_headings[tree] = self._COLUMN_NAMES[kind]
+        self._row_keys[tree] = {}  # item id -> {column: (parsed, lowered text)}
+        
+        # One click handler per tree; it resolves the clicked column itself
+        tree.bind("<Button-1>", self._on_header_click, add="+")
+    
+    def _on_header_click(self, event):
+        """Sort by the column whose heading was clicked"""
+        tree = event.widget
+        if tree.identify_region(event.x, event.y) != "heading":
+            return
         
-        # Bind click event to each column header
-        for col in columns:
-            tree.heading(col, command=lambda c=col, t=tree: self._sort_column(t, c))
+        col = tree.column(tree.identify_column(event.x), "id")
+        if col in self._sort_state[tree]:
+            self._sort_column(tree, col)
     
     def _sort_column(self, tree, col):
         """
@@ -177,30 +261,66 @@ class PriceGui(tk.Tk):
             tree: The treeview widget
             col: Column to sort by
         """
-        tree_id = str(id(tree))
-        
         # Toggle sort direction
-        ascending = self._sort_state[tree_id][col]
-        self._sort_state[tree_id][col] = not ascending
+        ascending = self._sort_state[tree][col]
+        self._sort_state[tree][col] = not ascending
+        
+        # Sort keys were parsed when the rows were inserted
+        row_keys = self._row_keys[tree]
+        items = tree.get_children('')
         
-        # Get all items
-        items = [(tree.set(item, col), item) for item in tree.get_children('')]
+        # Rows inserted outside _bulk_insert have no cached keys yet
+        columns = self._sort_columns[tree]
+        for item in items:
+            if item not in row_keys:
+                values = [tree.set(item, col) for col in columns]
+                row_keys[item] = self._row_sort_keys(columns, values)
         
         # Sort items
         try:
             # Try numeric sort first
-            items_sorted = sorted(items, key=lambda x: self._parse_sort_value(x[0]), reverse=ascending)
-        except:
+            items_sorted = sorted(items, key=lambda item: row_keys[item][col][0], reverse=ascending)
+        except TypeError:
             # Fall back to string sort
-            items_sorted = sorted(items, key=lambda x: x[0].lower(), reverse=ascending)
+            items_sorted = sorted(items, key=lambda item: row_keys[item][col][1], reverse=ascending)
         
-        # Rearrange items in sorted positions
-        for index, (val, item) in enumerate(items_sorted):
-            tree.move(item, '', index)
+        # Rearrange items in one Tcl call instead of a move per row
+        tree.set_children('', *items_sorted)
         
         # Update column heading to show sort direction
         self._update_column_headers(tree, col, ascending)
     
+    def _bulk_insert(self, tree, rows, iids=None) -> None:
+        """
+        Append rows to a sortable treeview in one Tcl call and cache their sort keys
+        
+        Args:
+            tree: The treeview widget
+            rows: List of (values, tags) tuples
+            iids: Optional item ids, one per row
+        """
+        options = [("-values", values, "-tags", tags) for values, tags in rows]
+        if iids is not None:
+            options = [("-id", iid) + row_options for iid, row_options in zip(iids, options)]
+        items = tree.tk.splitlist(tree.tk.call("::portfolio_insert_rows", str(tree), options))
+        
+        columns = self._sort_columns[tree]
+        row_keys = self._row_keys[tree]
+        for item, (values, _) in zip(items, rows):
+            row_keys[item] = self._row_sort_keys(columns, values)
+    
+    def _row_sort_keys(self, columns, values) -> dict:
+        """Sort keys of one row: column -> (parsed, lowered text)"""
+        return {
+            col: (self._parse_sort_value(text), text.casefold())
+            for col, text in zip(columns, map(str, values))
+        }
+    
+    def _clear_tree(self, tree) -> None:
+        """Remove all rows of a sortable treeview and their cached sort keys"""
+        tree.delete(*tree.get_children())
+        self._row_keys[tree].clear()
+    
     def _parse_sort_value(self, value):
         """
         Parse value for sorting (handle numbers, dates, percentages)
@@ -215,14 +335,14 @@ class PriceGui(tk.Tk):
             return float('-inf')  # Put empty/dash values at the end
         
         # Remove common formatting
-        clean_value = value.replace('.', '').replace(',', '.').replace('€', '').replace('%', '').replace('+', '').strip()
+        clean_value = value.translate(_SORT_TRANS).strip()
         
         try:
             # Try to convert to float
             return float(clean_value)
-        except:
+        except ValueError:
             # Return as string for text sorting
-            return value.lower()
+            return value.casefold()
     
     def _update_column_headers(self, tree, sorted_col, ascending):
         """
@@ -233,51 +353,8 @@ class PriceGui(tk.Tk):
             sorted_col: Currently sorted column
             ascending: Sort direction
         """
-        tree_id = str(id(tree))
-        
-        # Get column configuration based on tree type
-        if tree == self.tree:
-            # Price table columns
-            column_names = {
-                "symbol": "Symbol",
-                "name": "Name",
-                "close": "Kurs",
-                "currency": "Währung",
-                "change": "Änderung %",
-                "date": "Datum",
-            }
-        elif tree == self.portfolio_tree:
-            # Portfolio table columns
-            column_names = {
-                "symbol": "Symbol",
-                "name": "Name",
-                "quantity": "Menge",
-                "avg_price": "Ø Kaufpreis",
-                "current_price": "Aktueller Kurs",
-                "value": "Wert",
-                "profit_loss": "Gewinn/Verlust",
-                "profit_percent": "G/V %",
-            }
-        elif hasattr(self, 'dividend_tree') and tree == self.dividend_tree:
-            column_names = {
-                "symbol": "Symbol",
-                "name": "Name",
-                "total_dividends": "Gesamt Netto",
-                "dividend_count": "Anzahl",
-                "average_dividend": "Ø Dividende",
-                "current_holdings": "Bestand",
-                "annual_yield": "Rendite %",
-                "currency": "Währung",
-            }
-        elif hasattr(self, 'alerts_tree') and tree == self.alerts_tree:
-            column_names = {
-                "symbol": "Symbol",
-                "name": "Name",
-                "type": "Typ",
-                "threshold": "Schwellwert",
-                "status": "Status",
-            }
-        else:
+        column_names = self._sort_headings.get(tree)
+        if column_names is None:
             return
         
         # Update all column headings
@@ -299,6 +376,7 @@ class PriceGui(tk.Tk):
         except:
             pass
         self._theme_manager.create_ttk_styles(style)
+        self._styled_palette = self._theme_manager.get_palette()
         
     def _setup_keybindings(self) -> None:
         """Setup keyboard shortcuts"""
@@ -371,16 +449,28 @@ class PriceGui(tk.Tk):
         self.notebook.add(alerts_tab, text="🔔 Alarme")
         self._build_alerts_tab(alerts_tab)
 
+        self._tab_refreshers = (
+            self._refresh_prices,
+            self._refresh_portfolio,
+            self._refresh_dividends,
+            self._refresh_alerts,
+        )
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
     def _apply_theme(self):
         """Apply current theme to all widgets"""
+        palette = self._theme_manager.get_palette()
+        if palette is self._applied_palette:
+            return
+
         self._theme_manager.apply_to_root(self)
-        self._setup_styles()
+        if palette is not self._styled_palette:
+            self._setup_styles()
 
         for tree_attr in ["tree", "portfolio_tree", "dividend_tree", "alerts_tree"]:
             if hasattr(self, tree_attr):
                 self._theme_manager.apply_to_treeview(getattr(self, tree_attr))
 
-        palette = self._theme_manager.get_palette()
         for widget in self._get_all_text_widgets():
             widget.configure(bg=palette.bg_card, fg=palette.fg_main, insertbackground=palette.fg_main)
 
@@ -388,6 +478,8 @@ class PriceGui(tk.Tk):
             icon = "🌙" if self._theme_manager.get_effective_mode() == ThemeMode.LIGHT else "☀️"
             self.btn_theme_toggle.config(text=icon)
 
+        self._applied_palette = palette
+
     def _get_all_text_widgets(self) -> list:
         """Get all Text widgets recursively"""
         text_widgets = []
@@ -402,7 +494,15 @@ class PriceGui(tk.Tk):
         return text_widgets
 
     def _on_theme_changed(self, palette: ColorPalette):
-        """Callback when theme changes"""
+        """Callback when theme changes; bursts collapse into one apply"""
+        if self._theme_apply_pending:
+            return
+        self._theme_apply_pending = True
+        self.after(50, self._apply_pending_theme)
+
+    def _apply_pending_theme(self) -> None:
+        """Apply the latest palette once the theme callbacks have settled"""
+        self._theme_apply_pending = False
         self._apply_theme()
         self.update_idletasks()
 
@@ -448,10 +548,7 @@ class PriceGui(tk.Tk):
         """Refresh data for currently selected tab."""
         try:
             if not hasattr(self, 'notebook'):
-                self._refresh_prices()
-                self._refresh_portfolio()
-                self._refresh_dividends()
-                self._refresh_alerts()
+                self._mark_tabs_dirty()
                 return
 
             tab_index = self.notebook.index(self.notebook.select())
@@ -464,13 +561,27 @@ class PriceGui(tk.Tk):
             elif tab_index == 3:
                 self._refresh_alerts()
             else:
-                self._refresh_prices()
-                self._refresh_portfolio()
-                self._refresh_dividends()
-                self._refresh_alerts()
+                self._mark_tabs_dirty()
+                return
+            self._dirty_tabs.discard(tab_index)
         except Exception as e:
             self._show_error("Fehler", PortfolioError("Aktualisieren fehlgeschlagen", str(e)))
 
+    def _mark_tabs_dirty(self, *tab_indexes: int) -> None:
+        """Mark tabs stale (all by default) and refresh the visible one now."""
+        self._dirty_tabs.update(tab_indexes or range(4))
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None) -> None:
+        """Refresh the selected tab if its data is stale."""
+        if not hasattr(self, 'notebook'):
+            return
+
+        tab_index = self.notebook.index(self.notebook.select())
+        if tab_index in self._dirty_tabs:
+            self._dirty_tabs.discard(tab_index)
+            self._tab_refreshers[tab_index]()
+
     def _on_exit_app(self) -> None:
         """Confirm and close application."""
         should_exit = messagebox.askyesno("Beenden", "Anwendung wirklich beenden?")
@@ -536,7 +647,7 @@ class PriceGui(tk.Tk):
             else:
                 target_path.parent.mkdir(parents=True, exist_ok=True)
                 temp_target = target_path.with_suffix(".db.import_tmp")
-                temp_target.write_bytes(source_path.read_bytes())
+                shutil.copyfile(source_path, temp_target)
                 temp_target.replace(target_path)
 
             if repository is not None:
@@ -544,10 +655,7 @@ class PriceGui(tk.Tk):
 
             self._load_data()
             self._sync_asset_combobox_values()
-            self._refresh_prices()
-            self._refresh_portfolio()
-            self._refresh_dividends()
-            self._refresh_alerts()
+            self._mark_tabs_dirty()
 
             backup_msg = f"\n\nBackup: {backup_name}" if backup_name else ""
             messagebox.showinfo(
@@ -568,8 +676,10 @@ class PriceGui(tk.Tk):
         try:
             conn = sqlite3.connect(db_path)
             cur = conn.cursor()
+            cur.execute("PRAGMA mmap_size = 268435456")
 
-            integrity = cur.execute("PRAGMA integrity_check").fetchone()
+            check = "PRAGMA integrity_check" if self._config.deep_import_check else "PRAGMA quick_check"
+            integrity = cur.execute(check).fetchone()
             if not integrity or integrity[0] != "ok":
                 raise PortfolioError(
                     "Ungültige Datenbank",
@@ -886,7 +996,7 @@ class PriceGui(tk.Tk):
         
         # Aktiviere sortierbare Spalten
         columns = ("symbol", "name", "close", "currency", "change", "date")
-        self._make_sortable(self.tree, columns)
+        self._make_sortable(self.tree, columns, "prices")
     
     def _show_price_context_menu(self, event):
         """Show context menu on right-click"""
@@ -1141,7 +1251,7 @@ class PriceGui(tk.Tk):
 
         self.dividend_tree.tag_configure('oddrow', background='#f8f9fa')
         self.dividend_tree.tag_configure('evenrow', background='#ffffff')
-        self._make_sortable(self.dividend_tree, columns)
+        self._make_sortable(self.dividend_tree, columns, "dividends")
 
     def _build_alerts_tab(self, parent: ttk.Frame) -> None:
         """Build alerts tab"""
@@ -1230,7 +1340,7 @@ class PriceGui(tk.Tk):
 
         self.alerts_tree.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
-        self._make_sortable(self.alerts_tree, columns)
+        self._make_sortable(self.alerts_tree, columns, "alerts")
         self._theme_manager.apply_to_treeview(self.alerts_tree)
 
         self.alerts_context_menu = tk.Menu(self, tearoff=0)
@@ -1307,14 +1417,15 @@ class PriceGui(tk.Tk):
         if not hasattr(self, 'alerts_tree'):
             return
 
-        for item in self.alerts_tree.get_children():
-            self.alerts_tree.delete(item)
+        self._clear_tree(self.alerts_tree)
 
         if self._alert_service is None:
             return
 
         alerts = self._alert_service.get_all_alerts(include_triggered=True)
 
+        rows = []
+        iids = []
         for idx, alert in enumerate(alerts):
             asset = next((a for a in self._assets if a.id == alert.asset_id), None)
             if not asset:
@@ -1334,14 +1445,10 @@ class PriceGui(tk.Tk):
             status = "✅ Ausgelöst" if alert.triggered else ("⏸️ Inaktiv" if not alert.active else "🔔 Aktiv")
             tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
 
-            self.alerts_tree.insert(
-                "",
-                "end",
-                iid=str(alert.id),
-                values=(asset.symbol, asset.name, type_str, threshold_text, status),
-                tags=(tag,)
-            )
+            rows.append(((asset.symbol, asset.name, type_str, threshold_text, status), (tag,)))
+            iids.append(str(alert.id))
 
+        self._bulk_insert(self.alerts_tree, rows, iids)
         self._theme_manager.apply_to_treeview(self.alerts_tree)
 
     def _check_alerts(self):
@@ -1493,9 +1600,9 @@ class PriceGui(tk.Tk):
 
     def _update_dividend_table(self) -> None:
         """Update dividend summary table"""
-        for item in self.dividend_tree.get_children():
-            self.dividend_tree.delete(item)
+        self._clear_tree(self.dividend_tree)
 
+        rows = []
         for idx, summary in enumerate(self._current_dividend_summary):
             tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
 
@@ -1506,7 +1613,7 @@ class PriceGui(tk.Tk):
             if summary.annual_yield is not None:
                 yield_str = f"{float(summary.annual_yield):.2f}".replace('.', ',') + "%"
 
-            self.dividend_tree.insert("", "end", values=(
+            rows.append(((
                 summary.symbol,
                 summary.name,
                 total_str,
@@ -1515,7 +1622,9 @@ class PriceGui(tk.Tk):
                 holdings_str,
                 yield_str,
                 summary.currency,
-            ), tags=tag)
+            ), tag))
+
+        self._bulk_insert(self.dividend_tree, rows)
 
     def _update_dividend_summary_labels(self) -> None:
         """Update dividend overview labels"""
@@ -1806,7 +1915,7 @@ class PriceGui(tk.Tk):
         
         # Aktiviere sortierbare Spalten
         columns = ("symbol", "name", "quantity", "avg_price", "current_price", "value", "profit_loss", "profit_percent")
-        self._make_sortable(self.portfolio_tree, columns)
+        self._make_sortable(self.portfolio_tree, columns, "portfolio")
     
     def _show_portfolio_context_menu_event(self, event):
         """Show portfolio context menu on right-click"""
@@ -2054,6 +2163,7 @@ class PriceGui(tk.Tk):
         try:
             price_filter = self._build_price_filter()
             self._current_prices = self._price_service.get_prices_filtered(price_filter)
+            self._chart_service.invalidate_cache()
             self._update_table()
         except DatabaseError as e:
             self._show_error("Datenbankfehler", e)
@@ -2076,9 +2186,9 @@ class PriceGui(tk.Tk):
     
     def _update_table(self) -> None:
         """Update price table with current prices"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._clear_tree(self.tree)
         
+        rows = []
         for idx, price in enumerate(self._current_prices):
             tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
             formatted_close = self._format_price(price.close)
@@ -2091,14 +2201,16 @@ class PriceGui(tk.Tk):
                 else:
                     tag = (tag, 'negative')
             
-            self.tree.insert("", "end", values=(
+            rows.append(((
                 price.symbol,
                 price.name,
                 formatted_close,
                 price.currency,
                 change_str,
                 price.price_date.isoformat(),
-            ), tags=tag)
+            ), tag))
+        
+        self._bulk_insert(self.tree, rows)
         
         count_text = f"Insgesamt {len(self._current_prices)} Einträge"
         if len(self._current_prices) == 0:
@@ -2155,7 +2267,12 @@ class PriceGui(tk.Tk):
             )
             
             fig = self._chart_service.create_chart(chart_prices, config)
-            ChartWindow(self, fig, title="📊 Kursdiagramm")
+            ChartWindow(
+                self,
+                fig,
+                title="📊 Kursdiagramm",
+                on_close=self._chart_service.release_figure
+            )
             
         except (ChartError, DataNotFoundError) as e:
             self._show_error("Diagrammfehler", e)
@@ -2442,10 +2559,10 @@ class PriceGui(tk.Tk):
     def _update_portfolio_table(self) -> None:
         """Update portfolio table with current positions"""
         # Clear existing items
-        for item in self.portfolio_tree.get_children():
-            self.portfolio_tree.delete(item)
+        self._clear_tree(self.portfolio_tree)
         
         # Populate table
+        rows = []
         for idx, summary in enumerate(self._current_portfolio):
             tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
             
@@ -2475,7 +2592,7 @@ class PriceGui(tk.Tk):
             else:
                 percent_str = "-" + percent_str + "%"
             
-            self.portfolio_tree.insert("", "end", values=(
+            rows.append(((
                 summary.symbol,
                 summary.name,
                 quantity_str,
@@ -2484,7 +2601,9 @@ class PriceGui(tk.Tk):
                 value_str,
                 profit_loss_str,
                 percent_str,
-            ), tags=tag)
+            ), tag))
+        
+        self._bulk_insert(self.portfolio_tree, rows)
         
         # Update count
         count_text = f"{len(self._current_portfolio)} Positionen"
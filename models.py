@@ -5,7 +5,7 @@ from enum import Enum
 from pathlib import Path
 from decimal import Decimal
 
-@dataclass
+@dataclass(frozen=True)
 class Asset:
     """Domain model for an asset"""
     id: int
@@ -202,6 +202,11 @@ class BackupInfo:
     created_date: datetime
     is_monthly: bool
     action_name: Optional[str] = None
+    
+    @property
+    def created_ts(self) -> int:
+        """created_date as Unix timestamp"""
+        return int(self.created_date.timestamp())
 
 
 class DividendType(Enum):
@@ -211,7 +216,7 @@ class DividendType(Enum):
     CAPITAL_RETURN = "capital_return"
 
 
-@dataclass
+@dataclass(slots=True)
 class Dividend:
     """Represents a dividend payment"""
     id: Optional[int]
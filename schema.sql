@@ -7,12 +7,11 @@ CREATE TABLE IF NOT EXISTS dividend (
     tax_withheld REAL DEFAULT 0,
     dividend_type TEXT DEFAULT 'regular',
     notes TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
     FOREIGN KEY (asset_id) REFERENCES asset(id) ON DELETE CASCADE,
     UNIQUE(asset_id, payment_date)
 );
 
-CREATE INDEX IF NOT EXISTS idx_dividend_asset ON dividend(asset_id);
 CREATE INDEX IF NOT EXISTS idx_dividend_date ON dividend(payment_date);
 
 CREATE TABLE IF NOT EXISTS price_alert (
@@ -26,9 +25,12 @@ CREATE TABLE IF NOT EXISTS price_alert (
     triggered_at TIMESTAMP,
     notification_sent INTEGER DEFAULT 0,
     notes TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
     FOREIGN KEY (asset_id) REFERENCES asset(id) ON DELETE CASCADE
 );
 
 CREATE INDEX IF NOT EXISTS idx_price_alert_asset ON price_alert(asset_id);
 CREATE INDEX IF NOT EXISTS idx_price_alert_active ON price_alert(active, triggered);
+
+CREATE INDEX IF NOT EXISTS idx_price_asset_date_close ON price(asset_id, price_date DESC, close);
+CREATE INDEX IF NOT EXISTS idx_price_date ON price(price_date);
@@ -13,6 +13,8 @@ class InputValidator:
     MAX_PRICE = Decimal("1000000000")
     MIN_PRICE = Decimal("0.00000001")
     MAX_STRING_LENGTH = 255
+    # Already-canonical codes that skip the checks in validate_currency
+    COMMON_CURRENCIES = frozenset({"EUR", "USD", "GBP", "CHF", "JPY"})
 
     @staticmethod
     def validate_quantity(quantity_str: str) -> Decimal:
@@ -95,6 +97,9 @@ class InputValidator:
     @staticmethod
     def validate_currency(currency: str) -> str:
         """Validate currency code"""
+        if currency in InputValidator.COMMON_CURRENCIES:
+            return currency
+
         if not currency or not currency.strip():
             raise ValidationError(
                 "Währung fehlt",